@@ -1 +1,2 @@
 from ._nexus_api import *
+from ._nexus_api_extensions import *
@@ -0,0 +1,1665 @@
+# pyright: reportPrivateUsage=false
+
+# Hand-written additions to the client in _nexus_api.py. That file is generated by
+# src/Nexus.ClientGenerator and must not be edited, so the classes below derive from the
+# generated ones and are exported under the same names instead.
+
+# Python <= 3.9
+from __future__ import annotations
+
+import asyncio
+import base64
+import importlib.util
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from io import BytesIO
+from tempfile import TemporaryFile
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Generic, Iterable, Iterator, Optional, Type, TypeVar,
+                    Union, cast)
+from uuid import UUID
+from zipfile import ZipFile
+
+import numpy as np
+from httpx import AsyncClient, Client, Limits, Request, Response
+
+from . import _nexus_api
+from ._nexus_api import (CatalogInfo, CatalogItem, CatalogMetadata,
+                         CatalogTimeRange, ExportParameters, JobStatus,
+                         JsonEncoder, NexusException, ResourceCatalog,
+                         TaskStatus, _json_encoder_options)
+
+# only these replace the generated names when the package re-exports both modules
+__all__ = [
+    "DataResponse",
+    "CatalogsClient",
+    "CatalogsAsyncClient",
+    "JobsClient",
+    "JobsAsyncClient",
+    "PackageReferencesClient",
+    "PackageReferencesAsyncClient",
+    "NexusClient",
+    "NexusAsyncClient"
+]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+# maximum number of concurrent data requests issued by load()
+_load_concurrency: int = 16
+
+# connection pool of clients created via create(); idle connections are kept alive
+# so that consecutive requests skip the TCP and TLS handshakes
+_http_limits = Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+
+# clients created via create() multiplex concurrent requests over a single HTTP/2 connection
+# if the optional h2 package is installed (httpx falls back to HTTP/1.1 for servers without HTTP/2 support)
+_http2: bool = importlib.util.find_spec("h2") is not None
+
+# export() polls the job status with exponential backoff between these delays (in seconds)
+_job_status_min_delay: float = 0.05
+_job_status_max_delay: float = 2.0
+
+# load() reuses catalog items found for the same set of resource paths for a short period of time
+# or until a request other than a GET request succeeds
+_catalog_cache_ttl: float = 60.0
+_catalog_cache_size: int = 64
+
+# export() extracts archives up to this size (in bytes) from memory instead of a temporary file
+_artifact_memory_limit: int = 64 * 1024 * 1024
+
+# export() writes the downloaded archive in chunks of this size (in bytes)
+_download_chunk_size: int = 1024 * 1024
+
+# upload_attachment_file() reads the file in chunks of this size (in bytes)
+_upload_chunk_size: int = 1024 * 1024
+
+# lookup() collects resource paths for this period of time (in seconds) or up to this number
+# of resource paths before they are searched with a single request
+_lookup_delay: float = 0.005
+_lookup_batch_size: int = 1000
+
+# clients created with cache_metadata enabled cache the responses of these rarely changing endpoints
+# for the max-age of their Cache-Control header or, if there is none, for this period of time (in seconds)
+_metadata_cache_ttl: float = 30.0
+
+# after that, async clients keep serving a cached response while they revalidate it in the background, for
+# the stale-while-revalidate period of its Cache-Control header or, if there is none, for this period of time
+_metadata_cache_stale_period: float = 270.0
+_metadata_urls = re.compile(r"/api/v1/(?:(?:sources|writers)/descriptions|catalogs/[^/?]+/(?:child-catalog-infos|timerange|license|attachments|metadata)|system/(?:file-type|help-link|configuration))(?:\?|$)")
+
+# requests which are sent with a method other than GET but do not modify anything
+_read_only_urls = re.compile(r"/api/v1/catalogs/search-items(?:\?|$)")
+
+def _json_dumps(value: Any) -> bytes:
+
+    # JsonEncoder.encode has already walked the whole value (and would not terminate for circular
+    # references), so the circular reference check is redundant
+    encoded = JsonEncoder.encode(value, _json_encoder_options)
+    return json.dumps(encoded, check_circular=False, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# response bodies are parsed from the raw UTF-8 bytes, with orjson when it is available
+_json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+class _RequestRecorder:
+    """
+    Stands in for a client to record the request a generated sub-client method would send, so that
+    hand-written methods reuse the generated URL templates, e.g. to stream a response instead of buffering it.
+    """
+
+    def _invoke(self, typeOfT: Any, method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Any) -> Any:
+        return (method, relative_url, accept_header_value)
+
+_RecordedRequest = tuple[str, str, Optional[str]]
+
+_request_recorder: Any = _RequestRecorder()
+_artifacts_requests = _nexus_api.ArtifactsClient(_request_recorder)
+_catalogs_requests = _nexus_api.CatalogsClient(_request_recorder)
+_data_requests = _nexus_api.DataClient(_request_recorder)
+
+def _to_nexus_exception(response: Response) -> NexusException:
+
+    message = response.text
+    status_code = f"N00.{response.status_code}"
+
+    if not message:
+        return NexusException(status_code, f"The HTTP request failed with status code {response.status_code}.")
+
+    else:
+        return NexusException(status_code, f"The HTTP request failed with status code {response.status_code}. The response message is: {message}")
+
+def _decode_content(typeOfT: Type[T], content: bytes) -> T:
+
+    jsonObject = _json_loads(content)
+    return_value = JsonEncoder.decode(typeOfT, jsonObject, _json_encoder_options)
+
+    if return_value is None:
+        raise NexusException("N01", "Response data could not be deserialized.")
+
+    return return_value
+
+def _get_cache_lifetime(response: Response) -> tuple[float, float]:
+
+    # returns the max-age and the stale-while-revalidate period of the response
+    cache_control = response.headers.get("Cache-Control")
+
+    if cache_control is None:
+        return (_metadata_cache_ttl, _metadata_cache_stale_period)
+
+    max_age = _metadata_cache_ttl
+    stale_period = 0.0
+
+    for directive in cache_control.split(","):
+
+        name, _, value = directive.partition("=")
+        name = name.strip().lower()
+
+        if name == "no-store" or name == "no-cache":
+            return (0.0, 0.0)
+
+        elif name == "max-age" or name == "stale-while-revalidate":
+
+            try:
+                seconds = float(int(value.strip().strip('"')))
+            except ValueError:
+                return (0.0, 0.0)
+
+            if name == "max-age":
+                max_age = seconds
+
+            else:
+                stale_period = seconds
+
+    # the response may have been stored by a shared cache for some time already
+    try:
+        max_age -= int(response.headers.get("Age", "0"))
+    except ValueError:
+        pass
+
+    return (max_age, stale_period)
+
+def _get_identity_content_length(response: Response) -> Optional[int]:
+
+    # Content-Length describes the encoded body, so it is only meaningful for uncompressed responses
+    if "Content-Encoding" in response.headers:
+        return None
+
+    try:
+        return int(response.headers["Content-Length"])
+    except:
+        return None
+
+def _map_concurrently(func: Callable[[K], T], keys: Iterable[K], concurrency: int = _load_concurrency) -> dict[K, T]:
+
+    if concurrency < 1:
+        raise ValueError("The concurrency must be at least 1.")
+
+    # the requests are latency-bound, so they are sent concurrently
+    unique_keys = list(dict.fromkeys(keys))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(unique_keys)))) as executor:
+
+        futures = [executor.submit(func, key) for key in unique_keys]
+
+        try:
+            return {key: future.result() for (key, future) in zip(unique_keys, futures)}
+
+        except:
+
+            for future in futures:
+                future.cancel()
+
+            raise
+
+async def _map_concurrently_async(func: Callable[[K], Awaitable[T]], keys: Iterable[K], concurrency: int = _load_concurrency) -> dict[K, T]:
+
+    # a semaphore with a value of 0 would never let any request through
+    if concurrency < 1:
+        raise ValueError("The concurrency must be at least 1.")
+
+    # the requests are latency-bound, so they are sent concurrently
+    unique_keys = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def invoke(key: K) -> T:
+
+        async with semaphore:
+            return await func(key)
+
+    tasks = [asyncio.ensure_future(invoke(key)) for key in unique_keys]
+
+    try:
+        values = await asyncio.gather(*tasks)
+
+    except:
+
+        for task in tasks:
+            task.cancel()
+
+        raise
+
+    return dict(zip(unique_keys, values))
+
+def _read_file_chunks(path: Union[str, os.PathLike[str]], chunk_size: int) -> Iterator[bytes]:
+
+    with open(path, "rb") as file:
+        yield from iter(lambda: file.read(chunk_size), b"")
+
+async def _read_file_chunks_async(path: Union[str, os.PathLike[str]], chunk_size: int) -> AsyncIterator[bytes]:
+
+    # the blocking reads run on a worker thread to keep the event loop responsive
+    with open(path, "rb") as file:
+
+        while True:
+
+            chunk = await asyncio.to_thread(file.read, chunk_size)
+
+            if not chunk:
+                break
+
+            yield chunk
+
+async def _iterate_async(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+
+    # the async HTTP client only streams async iterables, so sync ones are adapted chunk by chunk
+    for chunk in chunks:
+        yield chunk
+
+class _AsyncBatcher(Generic[T]):
+    """Combines single-key requests which are issued within a short period of time into a single batch request."""
+
+    def __init__(self, invoke_batch: Callable[[list[str]], Awaitable[dict[str, T]]], delay: float, max_size: int):
+        self._invoke_batch = invoke_batch
+        self._delay = delay
+        self._max_size = max_size
+        self._pending: dict[str, list[asyncio.Future[T]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # the event loop keeps weak references to tasks only
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, key: str) -> T:
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self._max_size:
+            self._flush()
+
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending = self._pending
+        self._pending = {}
+
+        task = asyncio.ensure_future(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: dict[str, list[asyncio.Future[T]]]) -> None:
+
+        try:
+            result = await self._invoke_batch(list(pending))
+
+        # the callers would otherwise wait forever, e.g. when the batch request has been cancelled
+        except BaseException as ex:
+
+            for futures in pending.values():
+
+                for future in futures:
+
+                    # the caller has been cancelled
+                    if not future.done():
+                        future.set_exception(ex)
+
+            # a cancelled batch task must end cancelled, all other errors have been passed to the callers
+            if not isinstance(ex, Exception):
+                raise
+
+            return
+
+        for (key, futures) in pending.items():
+
+            for future in futures:
+
+                # the caller has been cancelled
+                if future.done():
+                    continue
+
+                if key in result:
+                    future.set_result(result[key])
+
+                else:
+                    future.set_exception(NexusException("N01", f"The response contains no result for {key}."))
+
+def _get_availability_data(availability: Any) -> list[float]:
+
+    # the values are copied straight into the array without creating a CatalogAvailability first
+    if isinstance(availability, dict):
+
+        for (key, value) in cast(dict[str, Any], availability).items():
+
+            if _json_encoder_options.property_name_decoder(key) == "data" and value is not None:
+                return value
+
+    raise NexusException("N01", "Response data could not be deserialized.")
+
+def _get_unit_and_description(catalog_item: CatalogItem) -> tuple[Optional[str], Optional[str]]:
+
+    properties = catalog_item.resource.properties or {}
+
+    unit = properties.get("unit")
+    description = properties.get("description")
+
+    return (
+        unit if isinstance(unit, str) else None,
+        description if isinstance(description, str) else None
+    )
+
+@dataclass(frozen=True)
+class DataResponse(_nexus_api.DataResponse):
+    """
+    Result of a data request with a certain resource path.
+
+    Args:
+        catalog_item: The catalog item.
+        name: The resource name.
+        unit: The optional resource unit.
+        description: The optional resource description.
+        sample_period: The sample period.
+        values: The data.
+    """
+
+    # a numpy array instead of the generated array("d"), which breaks the base type (see CHANGELOG.md)
+    values: np.ndarray # pyright: ignore[reportIncompatibleVariableOverride]
+    """The data."""
+
+class CatalogsAsyncClient(_nexus_api.CatalogsAsyncClient):
+    """Provides methods to interact with catalogs."""
+
+    _client: NexusAsyncClient
+    _lookup_batcher: _AsyncBatcher[CatalogItem]
+
+    def __init__(self, client: NexusAsyncClient):
+        super().__init__(client)
+        self._client = client
+        self._lookup_batcher = _AsyncBatcher(self.search_catalog_items, _lookup_delay, _lookup_batch_size)
+
+    def lookup(self, resource_path: str) -> Awaitable[CatalogItem]:
+        """
+        Searches for the given resource path and returns the corresponding catalog item. Lookups which are
+        issued concurrently are combined into a single search request. If the search fails, all combined
+        lookups fail.
+
+        Args:
+            resource_path: The resource path.
+        """
+
+        return self._lookup_batcher.submit(resource_path)
+
+    def get_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> Awaitable[dict[str, ResourceCatalog]]:
+        """
+        Gets the specified catalogs. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently_async(self.get, catalog_ids, concurrency)
+
+    def get_child_catalog_infos_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> Awaitable[dict[str, list[CatalogInfo]]]:
+        """
+        Gets the specified catalogs' child catalog infos. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently_async(self.get_child_catalog_infos, catalog_ids, concurrency)
+
+    def get_time_range_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> Awaitable[dict[str, CatalogTimeRange]]:
+        """
+        Gets the specified catalogs' time ranges. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently_async(self.get_time_range, catalog_ids, concurrency)
+
+    async def get_availability_array(self, catalog_id: str, begin: datetime, end: datetime, step: timedelta) -> np.ndarray:
+        """
+        Gets the specified catalog's availability as float64 array instead of a list of Python floats.
+
+        Args:
+            catalog_id: The catalog identifier.
+            begin: Start date/time.
+            end: End date/time.
+            step: Step period.
+        """
+
+        (method, url, accept) = cast(_RecordedRequest, _catalogs_requests.get_availability(catalog_id, begin, end, step))
+
+        async with self._client._invoke_stream(method, url, accept) as response:
+            availability = _json_loads(await response.aread())
+
+        return np.asarray(_get_availability_data(availability), dtype=np.float64)
+
+    def upload_attachment_file(self, catalog_id: str, attachment_id: str, path: Union[str, os.PathLike[str]], chunk_size: int = _upload_chunk_size) -> Awaitable[Response]:
+        """
+        Uploads the specified file as attachment. The file is streamed in chunks instead of being loaded into memory.
+
+        Args:
+            catalog_id: The catalog identifier.
+            attachment_id: The attachment identifier.
+            path: The path of the file to upload.
+            chunk_size: The size of the chunks (in bytes).
+        """
+
+        return self.upload_attachment(catalog_id, attachment_id, _read_file_chunks_async(path, chunk_size))
+
+    def get_metadata_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> Awaitable[dict[str, CatalogMetadata]]:
+        """
+        Gets the specified catalogs' metadata. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently_async(self.get_metadata, catalog_ids, concurrency)
+
+class JobsAsyncClient(_nexus_api.JobsAsyncClient):
+    """Provides methods to interact with jobs."""
+
+    async def wait_for_job(self, job_id: UUID, timeout: Optional[float] = None) -> JobStatus:
+        """
+        Waits until the specified job has run to completion, failed or been canceled and returns its final status.
+        The status is polled with increasing delays, so short jobs are observed as finished quickly.
+
+        Args:
+            job_id: The job identifier.
+            timeout: The optional maximum time to wait (in seconds).
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = _job_status_min_delay
+
+        while True:
+
+            job_status = await self.get_job_status(job_id)
+
+            if job_status.status in (TaskStatus.RAN_TO_COMPLETION, TaskStatus.FAULTED, TaskStatus.CANCELED):
+                return job_status
+
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"The job {job_id} has not finished in time.")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, _job_status_max_delay)
+
+    def get_job_status_many(self, job_ids: Iterable[UUID], concurrency: int = _load_concurrency) -> Awaitable[dict[UUID, JobStatus]]:
+        """
+        Gets the status of the specified jobs. The requests are sent concurrently.
+
+        Args:
+            job_ids: The job identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently_async(self.get_job_status, job_ids, concurrency)
+
+class PackageReferencesAsyncClient(_nexus_api.PackageReferencesAsyncClient):
+    """Provides methods to interact with package references."""
+
+    def get_versions_many(self, package_reference_ids: Iterable[UUID], concurrency: int = _load_concurrency) -> Awaitable[dict[UUID, list[str]]]:
+        """
+        Gets the versions of the specified package references. The requests are sent concurrently.
+
+        Args:
+            package_reference_ids: The package reference identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently_async(self.get_versions, package_reference_ids, concurrency)
+
+class CatalogsClient(_nexus_api.CatalogsClient):
+    """Provides methods to interact with catalogs."""
+
+    _client: NexusClient
+
+    def __init__(self, client: NexusClient):
+        super().__init__(client)
+        self._client = client
+
+    def get_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> dict[str, ResourceCatalog]:
+        """
+        Gets the specified catalogs. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently(self.get, catalog_ids, concurrency)
+
+    def get_child_catalog_infos_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> dict[str, list[CatalogInfo]]:
+        """
+        Gets the specified catalogs' child catalog infos. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently(self.get_child_catalog_infos, catalog_ids, concurrency)
+
+    def get_time_range_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> dict[str, CatalogTimeRange]:
+        """
+        Gets the specified catalogs' time ranges. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently(self.get_time_range, catalog_ids, concurrency)
+
+    def get_availability_array(self, catalog_id: str, begin: datetime, end: datetime, step: timedelta) -> np.ndarray:
+        """
+        Gets the specified catalog's availability as float64 array instead of a list of Python floats.
+
+        Args:
+            catalog_id: The catalog identifier.
+            begin: Start date/time.
+            end: End date/time.
+            step: Step period.
+        """
+
+        (method, url, accept) = cast(_RecordedRequest, _catalogs_requests.get_availability(catalog_id, begin, end, step))
+
+        with self._client._invoke_stream(method, url, accept) as response:
+            availability = _json_loads(response.read())
+
+        return np.asarray(_get_availability_data(availability), dtype=np.float64)
+
+    def upload_attachment_file(self, catalog_id: str, attachment_id: str, path: Union[str, os.PathLike[str]], chunk_size: int = _upload_chunk_size) -> Response:
+        """
+        Uploads the specified file as attachment. The file is streamed in chunks instead of being loaded into memory.
+
+        Args:
+            catalog_id: The catalog identifier.
+            attachment_id: The attachment identifier.
+            path: The path of the file to upload.
+            chunk_size: The size of the chunks (in bytes).
+        """
+
+        return self.upload_attachment(catalog_id, attachment_id, _read_file_chunks(path, chunk_size))
+
+    def get_metadata_many(self, catalog_ids: Iterable[str], concurrency: int = _load_concurrency) -> dict[str, CatalogMetadata]:
+        """
+        Gets the specified catalogs' metadata. The requests are sent concurrently.
+
+        Args:
+            catalog_ids: The catalog identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently(self.get_metadata, catalog_ids, concurrency)
+
+class JobsClient(_nexus_api.JobsClient):
+    """Provides methods to interact with jobs."""
+
+    def wait_for_job(self, job_id: UUID, timeout: Optional[float] = None) -> JobStatus:
+        """
+        Waits until the specified job has run to completion, failed or been canceled and returns its final status.
+        The status is polled with increasing delays, so short jobs are observed as finished quickly.
+
+        Args:
+            job_id: The job identifier.
+            timeout: The optional maximum time to wait (in seconds).
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = _job_status_min_delay
+
+        while True:
+
+            job_status = self.get_job_status(job_id)
+
+            if job_status.status in (TaskStatus.RAN_TO_COMPLETION, TaskStatus.FAULTED, TaskStatus.CANCELED):
+                return job_status
+
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"The job {job_id} has not finished in time.")
+
+            time.sleep(delay)
+            delay = min(delay * 1.5, _job_status_max_delay)
+
+    def get_job_status_many(self, job_ids: Iterable[UUID], concurrency: int = _load_concurrency) -> dict[UUID, JobStatus]:
+        """
+        Gets the status of the specified jobs. The requests are sent concurrently.
+
+        Args:
+            job_ids: The job identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently(self.get_job_status, job_ids, concurrency)
+
+class PackageReferencesClient(_nexus_api.PackageReferencesClient):
+    """Provides methods to interact with package references."""
+
+    def get_versions_many(self, package_reference_ids: Iterable[UUID], concurrency: int = _load_concurrency) -> dict[UUID, list[str]]:
+        """
+        Gets the versions of the specified package references. The requests are sent concurrently.
+
+        Args:
+            package_reference_ids: The package reference identifiers.
+            concurrency: The maximum number of concurrent requests, at least 1.
+        """
+
+        return _map_concurrently(self.get_versions, package_reference_ids, concurrency)
+
+class NexusAsyncClient(_nexus_api.NexusAsyncClient):
+    """A client for the Nexus system."""
+
+    _catalog_cache: dict[frozenset[str], tuple[float, dict[str, CatalogItem]]]
+    _metadata_cache: Optional[dict[str, tuple[float, float, bytes]]]
+    _metadata_cache_version: int
+    _metadata_refresh_tasks: dict[str, asyncio.Task[None]]
+
+    @classmethod
+    def create(cls, base_url: str, cache_metadata: bool = False) -> NexusAsyncClient:
+        """
+        Initializes a new instance of the NexusAsyncClient
+
+            Args:
+                base_url: The base URL to use.
+                cache_metadata: Whether to cache the responses of rarely changing endpoints like the catalog metadata or the writer descriptions.
+        """
+        return cls(AsyncClient(base_url=base_url, timeout=60.0, limits=_http_limits, http2=_http2), cache_metadata)
+
+    def __init__(self, http_client: AsyncClient, cache_metadata: bool = False):
+        """
+        Initializes a new instance of the NexusAsyncClient
+
+            Args:
+                http_client: The HTTP client to use.
+                cache_metadata: Whether to cache the responses of rarely changing endpoints like the catalog metadata or the writer descriptions.
+        """
+
+        super().__init__(http_client)
+
+        self._catalogs = CatalogsAsyncClient(self)
+        self._jobs = JobsAsyncClient(self)
+        self._packageReferences = PackageReferencesAsyncClient(self)
+        self._catalog_cache = {}
+        self._metadata_cache = {} if cache_metadata else None
+        self._metadata_cache_version = 0
+        self._metadata_refresh_tasks = {}
+
+    @property
+    def catalogs(self) -> CatalogsAsyncClient:
+        """Gets the CatalogsAsyncClient."""
+        return cast(CatalogsAsyncClient, self._catalogs)
+
+    @property
+    def jobs(self) -> JobsAsyncClient:
+        """Gets the JobsAsyncClient."""
+        return cast(JobsAsyncClient, self._jobs)
+
+    @property
+    def package_references(self) -> PackageReferencesAsyncClient:
+        """Gets the PackageReferencesAsyncClient."""
+        return cast(PackageReferencesAsyncClient, self._packageReferences)
+
+    def attach_configuration(self, configuration: Any) -> Any:
+        """Attaches configuration data to subsequent API requests.
+
+        Args:
+            configuration: The configuration data.
+        """
+
+        encoded_json = base64.b64encode(_json_dumps(configuration)).decode("utf-8")
+
+        if self._configuration_header_key in self._http_client.headers:
+            del self._http_client.headers[self._configuration_header_key]
+
+        self._http_client.headers[self._configuration_header_key] = encoded_json
+        self.invalidate_catalog_cache()
+        self.invalidate_metadata_cache()
+
+        return _nexus_api._DisposableAsyncConfiguration(self)
+
+    def sign_in(self, access_token: str):
+        """Signs in the user.
+
+        Args:
+            access_token: The access token.
+        """
+
+        super().sign_in(access_token)
+        self.invalidate_catalog_cache()
+        self.invalidate_metadata_cache()
+
+    def clear_configuration(self) -> None:
+        """Clears configuration data for all subsequent API requests."""
+
+        super().clear_configuration()
+        self.invalidate_catalog_cache()
+        self.invalidate_metadata_cache()
+
+    def invalidate_catalog_cache(self) -> None:
+        """Clears the catalog items which load() has cached."""
+        self._catalog_cache.clear()
+
+    def invalidate_metadata_cache(self) -> None:
+        """Clears the responses which have been cached because cache_metadata is enabled."""
+
+        self._metadata_cache_version += 1
+
+        if self._metadata_cache is not None:
+            self._metadata_cache.clear()
+
+    async def _invoke(self, typeOfT: Optional[Type[T]], method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Union[None, str, bytes, Iterable[bytes], AsyncIterable[bytes]]) -> T:
+
+        # the generated methods append the query separator even if none of their optional query parameters is set
+        relative_url = relative_url.removesuffix("?")
+
+        if self._metadata_cache is not None:
+
+            if method == "GET":
+
+                if typeOfT is not Response and _metadata_urls.match(relative_url):
+                    return await self._invoke_cached(cast(Type[T], typeOfT), relative_url, accept_header_value)
+
+            # any other request may modify the metadata
+            elif not _read_only_urls.match(relative_url):
+                self.invalidate_metadata_cache()
+
+        # prepare request
+        request = self._build_request_message(method, relative_url, content, content_type_value, accept_header_value)
+
+        # send request
+        response = await self._http_client.send(request)
+
+        # process response
+        try:
+
+            if not response.is_success:
+                raise _to_nexus_exception(response)
+
+            # any other successful request may have modified the catalogs
+            if method != "GET" and not _read_only_urls.match(relative_url):
+                self.invalidate_catalog_cache()
+
+            if typeOfT is type(None):
+                return cast(T, type(None))
+
+            # the caller takes ownership of the response
+            elif typeOfT is Response:
+                return cast(T, response)
+
+            else:
+                return _decode_content(cast(Type[T], typeOfT), response.content)
+
+        finally:
+            if typeOfT is not Response or not response.is_success:
+                await response.aclose()
+
+    async def _invoke_cached(self, typeOfT: Type[T], relative_url: str, accept_header_value: Optional[str]) -> T:
+
+        metadata_cache = cast(dict[str, tuple[float, float, bytes]], self._metadata_cache)
+        entry = metadata_cache.get(relative_url)
+        now = time.monotonic()
+
+        if entry is None or now >= entry[1]:
+            content = await self._fetch_cached(relative_url, accept_header_value)
+
+        else:
+
+            content = entry[2]
+
+            # stale: serve the cached body and revalidate it in the background
+            if now >= entry[0] and relative_url not in self._metadata_refresh_tasks:
+                self._metadata_refresh_tasks[relative_url] = asyncio.ensure_future(self._refresh_cached(relative_url, accept_header_value))
+
+        # the body is decoded on every call so that callers never share mutable objects
+        return _decode_content(typeOfT, content)
+
+    async def _refresh_cached(self, relative_url: str, accept_header_value: Optional[str]) -> None:
+
+        try:
+            await self._fetch_cached(relative_url, accept_header_value)
+
+        # the stale body remains in use until it expires
+        except Exception:
+            pass
+
+        finally:
+            if self._metadata_refresh_tasks.get(relative_url) is asyncio.current_task():
+                del self._metadata_refresh_tasks[relative_url]
+
+    async def _fetch_cached(self, relative_url: str, accept_header_value: Optional[str]) -> bytes:
+
+        metadata_cache = cast(dict[str, tuple[float, float, bytes]], self._metadata_cache)
+        version = self._metadata_cache_version
+        request = self._build_request_message("GET", relative_url, None, None, accept_header_value)
+        response = await self._http_client.send(request)
+
+        try:
+
+            if not response.is_success:
+                raise _to_nexus_exception(response)
+
+            content = response.content
+            (max_age, stale_period) = _get_cache_lifetime(response)
+
+        finally:
+            await response.aclose()
+
+        # the response is outdated if the cache has been invalidated in the meantime
+        if version == self._metadata_cache_version:
+
+            metadata_cache.pop(relative_url, None)
+
+            if max_age + stale_period > 0:
+                now = time.monotonic()
+                metadata_cache[relative_url] = (now + max_age, now + max_age + stale_period, content)
+
+        return content
+
+    @asynccontextmanager
+    async def _invoke_stream(self, method: str, relative_url: str, accept_header_value: Optional[str]) -> AsyncIterator[Response]:
+
+        headers = { "Accept": accept_header_value } if accept_header_value is not None else None
+
+        # the response is released when the context exits
+        async with self._http_client.stream(method, relative_url, headers=headers) as response:
+
+            if not response.is_success:
+                await response.aread()
+                raise _to_nexus_exception(response)
+
+            yield response
+
+    def _build_request_message(self, method: str, relative_url: str, content: Any, content_type_value: Optional[str], accept_header_value: Optional[str]) -> Request:
+
+        # headers are merged with the client headers once while the request is built
+        headers: dict[str, str] = {}
+
+        if content_type_value is not None:
+            headers["Content-Type"] = content_type_value
+
+        if accept_header_value is not None:
+            headers["Accept"] = accept_header_value
+
+        # sync iterables are streamed without being joined into a single buffer first
+        if content is not None and not isinstance(content, (str, bytes, AsyncIterable)):
+            content = _iterate_async(content)
+
+        request_message = self._http_client.build_request(method, relative_url, content = content, headers = headers)
+
+        return request_message
+
+    # "disposable" methods
+    async def __aenter__(self) -> NexusAsyncClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client and its connection pool, which is shared by all sub-clients."""
+
+        # background revalidations would otherwise use the closed HTTP client
+        for task in list(self._metadata_refresh_tasks.values()):
+            task.cancel()
+
+        if (self._http_client is not None):
+            await self._http_client.aclose()
+
+    # returns the DataResponse subclass with numpy values, see DataResponse
+    async def load( # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        begin: datetime,
+        end: datetime,
+        resource_paths: Iterable[str],
+        on_progress: Optional[Callable[[float], None]]) -> dict[str, DataResponse]:
+        """This high-level methods simplifies loading multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            resource_paths: The resource paths.
+            onProgress: A callback which accepts the current progress.
+        """
+
+        # duplicate paths would be searched and downloaded multiple times
+        unique_resource_paths = list(dict.fromkeys(resource_paths))
+
+        catalog_item_map = await self._search_catalog_items_cached(unique_resource_paths)
+        result: dict[str, DataResponse] = {}
+        count = len(catalog_item_map)
+
+        # the requests are latency-bound, so they are sent concurrently
+        semaphore = asyncio.Semaphore(_load_concurrency)
+        completed = 0
+
+        async def load_one(resource_path: str, catalog_item: CatalogItem) -> DataResponse:
+            nonlocal completed
+
+            async with semaphore:
+                data_response = await self._load_one(resource_path, catalog_item, begin, end)
+
+            completed += 1
+
+            if on_progress is not None:
+                on_progress(completed / count)
+
+            return data_response
+
+        tasks = [
+            asyncio.ensure_future(load_one(resource_path, catalog_item))
+            for (resource_path, catalog_item) in catalog_item_map.items()
+        ]
+
+        try:
+            data_responses = await asyncio.gather(*tasks)
+
+        except:
+
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+        # keep the order of the catalog item map
+        for (resource_path, data_response) in zip(catalog_item_map.keys(), data_responses):
+            result[resource_path] = data_response
+
+        return result
+
+    async def _load_one(self, resource_path: str, catalog_item: CatalogItem, begin: datetime, end: datetime) -> DataResponse:
+
+        (method, url, accept) = cast(_RecordedRequest, _data_requests.get_stream(resource_path, begin, end))
+
+        async with self._invoke_stream(method, url, accept) as response:
+            double_data = await self._read_as_double(response)
+
+        (unit, description) = _get_unit_and_description(catalog_item)
+
+        return DataResponse(
+            catalog_item=catalog_item,
+            name=catalog_item.resource.id,
+            unit=unit,
+            description=description,
+            sample_period=catalog_item.representation.sample_period,
+            values=double_data
+        )
+
+    async def _search_catalog_items_cached(self, resource_paths: list[str]) -> dict[str, CatalogItem]:
+
+        key = frozenset(resource_paths)
+        now = time.monotonic()
+        entry = self._catalog_cache.pop(key, None)
+
+        if entry is None or now - entry[0] >= _catalog_cache_ttl:
+            entry = (now, await self.catalogs.search_catalog_items(resource_paths))
+
+        # re-insert to keep the most recently used entry last
+        self._catalog_cache[key] = entry
+
+        if len(self._catalog_cache) > _catalog_cache_size:
+            del self._catalog_cache[next(iter(self._catalog_cache))]
+
+        return entry[1]
+
+    # returns a numpy array, see DataResponse
+    async def _read_as_double(self, response: Response): # pyright: ignore[reportIncompatibleMethodOverride]
+
+        length = _get_identity_content_length(response)
+
+        # unknown length: buffer the whole body in a bytearray so that the array is writable
+        # like the one which is filled in place below
+        if length is None:
+
+            byteBuffer = bytearray()
+
+            async for chunk in response.aiter_bytes():
+                byteBuffer += chunk
+
+            if len(byteBuffer) % 8 != 0:
+                raise NexusException("N01", "The data length is invalid.")
+
+            doubleBuffer = np.frombuffer(byteBuffer, dtype="<f8")
+
+            return doubleBuffer
+
+        # known length: copy the chunks directly into the target buffer
+        if length == 0:
+            return np.empty(0, dtype="<f8")
+
+        if length % 8 != 0:
+            raise NexusException("N01", "The data length is invalid.")
+
+        doubleBuffer = np.empty(length // 8, dtype="<f8")
+        byteBuffer = doubleBuffer.view(np.uint8).data
+        offset = 0
+
+        async for chunk in response.aiter_bytes():
+
+            next_offset = offset + len(chunk)
+
+            if next_offset > length:
+                raise NexusException("N01", "The data length is invalid.")
+
+            byteBuffer[offset:next_offset] = chunk
+            offset = next_offset
+
+        if offset != length:
+            raise NexusException("N01", "The data length is invalid.")
+
+        return doubleBuffer
+
+    async def export(
+        self,
+        begin: datetime,
+        end: datetime,
+        file_period: timedelta,
+        file_format: Optional[str],
+        resource_paths: Iterable[str],
+        configuration: dict[str, object],
+        target_folder: str,
+        on_progress: Optional[Callable[[float, str], None]]) -> None:
+        """This high-level methods simplifies exporting multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            filePeriod: The file period. Use timedelta(0) to get a single file.
+            fileFormat: The target file format. If null, data will be read (and possibly cached) but not returned. This is useful for data pre-aggregation.
+            resource_paths: The resource paths to export.
+            configuration: The configuration.
+            targetFolder: The target folder for the files to extract.
+            onProgress: A callback which accepts the current progress and the progress message.
+        """
+
+        export_parameters = ExportParameters(
+            begin,
+            end,
+            file_period,
+            file_format,
+            list(resource_paths),
+            configuration
+        )
+
+        # Start job
+        job = await self.jobs.export(export_parameters)
+
+        # Wait for job to finish
+        artifact_id: Optional[str] = None
+        delay = _job_status_min_delay
+
+        while True:
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, _job_status_max_delay)
+
+            job_status = await self.jobs.get_job_status(job.id)
+
+            if (job_status.status == TaskStatus.CANCELED):
+                raise Exception("The job has been cancelled.")
+
+            elif (job_status.status == TaskStatus.FAULTED):
+                raise Exception(f"The job has failed. Reason: {job_status.exception_message}")
+
+            elif (job_status.status == TaskStatus.RAN_TO_COMPLETION):
+
+                if (job_status.result is not None and \
+                    type(job_status.result) == str):
+
+                    artifact_id = cast(Optional[str], job_status.result)
+
+                    break
+
+            if job_status.progress < 1 and on_progress is not None:
+                on_progress(job_status.progress, "export")
+
+        if on_progress is not None:
+            on_progress(1, "export")
+
+        if artifact_id is None:
+            raise Exception("The job result is invalid.")
+
+        if file_format is None:
+            return
+
+        # Download zip file
+        with ExitStack() as stack:
+
+            (method, url, accept) = cast(_RecordedRequest, _artifacts_requests.download(artifact_id))
+
+            async with self._invoke_stream(method, url, accept) as response:
+
+                length = _get_identity_content_length(response)
+
+                # small archives are kept in memory, all others are spooled to an anonymous temporary file
+                target_stream = stack.enter_context(
+                    BytesIO() if length is not None and length <= _artifact_memory_limit else TemporaryFile())
+
+                consumed = 0.0
+
+                async for data in response.aiter_bytes(_download_chunk_size):
+
+                    target_stream.write(data)
+                    consumed += len(data)
+
+                    if length is not None and on_progress is not None:
+                        if consumed < length:
+                            on_progress(consumed / length, "download")
+
+            if on_progress is not None:
+                on_progress(1, "download")
+
+            # Extract file
+            with ZipFile(target_stream, "r") as zipFile:
+                zipFile.extractall(target_folder)
+
+        if on_progress is not None:
+            on_progress(1, "extract")
+
+class NexusClient(_nexus_api.NexusClient):
+    """A client for the Nexus system."""
+
+    _catalog_cache: dict[frozenset[str], tuple[float, dict[str, CatalogItem]]]
+    _metadata_cache: Optional[dict[str, tuple[float, float, bytes]]]
+    _metadata_cache_version: int
+
+    @classmethod
+    def create(cls, base_url: str, cache_metadata: bool = False) -> NexusClient:
+        """
+        Initializes a new instance of the NexusClient
+
+            Args:
+                base_url: The base URL to use.
+                cache_metadata: Whether to cache the responses of rarely changing endpoints like the catalog metadata or the writer descriptions.
+        """
+        return cls(Client(base_url=base_url, timeout=60.0, limits=_http_limits, http2=_http2), cache_metadata)
+
+    def __init__(self, http_client: Client, cache_metadata: bool = False):
+        """
+        Initializes a new instance of the NexusClient
+
+            Args:
+                http_client: The HTTP client to use.
+                cache_metadata: Whether to cache the responses of rarely changing endpoints like the catalog metadata or the writer descriptions.
+        """
+
+        super().__init__(http_client)
+
+        self._catalogs = CatalogsClient(self)
+        self._jobs = JobsClient(self)
+        self._packageReferences = PackageReferencesClient(self)
+        self._catalog_cache = {}
+        self._metadata_cache = {} if cache_metadata else None
+        self._metadata_cache_version = 0
+
+    @property
+    def catalogs(self) -> CatalogsClient:
+        """Gets the CatalogsClient."""
+        return cast(CatalogsClient, self._catalogs)
+
+    @property
+    def jobs(self) -> JobsClient:
+        """Gets the JobsClient."""
+        return cast(JobsClient, self._jobs)
+
+    @property
+    def package_references(self) -> PackageReferencesClient:
+        """Gets the PackageReferencesClient."""
+        return cast(PackageReferencesClient, self._packageReferences)
+
+    def attach_configuration(self, configuration: Any) -> Any:
+        """Attaches configuration data to subsequent API requests.
+
+        Args:
+            configuration: The configuration data.
+        """
+
+        encoded_json = base64.b64encode(_json_dumps(configuration)).decode("utf-8")
+
+        if self._configuration_header_key in self._http_client.headers:
+            del self._http_client.headers[self._configuration_header_key]
+
+        self._http_client.headers[self._configuration_header_key] = encoded_json
+        self.invalidate_catalog_cache()
+        self.invalidate_metadata_cache()
+
+        return _nexus_api._DisposableConfiguration(self)
+
+    def sign_in(self, access_token: str):
+        """Signs in the user.
+
+        Args:
+            access_token: The access token.
+        """
+
+        super().sign_in(access_token)
+        self.invalidate_catalog_cache()
+        self.invalidate_metadata_cache()
+
+    def clear_configuration(self) -> None:
+        """Clears configuration data for all subsequent API requests."""
+
+        super().clear_configuration()
+        self.invalidate_catalog_cache()
+        self.invalidate_metadata_cache()
+
+    def invalidate_catalog_cache(self) -> None:
+        """Clears the catalog items which load() has cached."""
+        self._catalog_cache.clear()
+
+    def invalidate_metadata_cache(self) -> None:
+        """Clears the responses which have been cached because cache_metadata is enabled."""
+
+        self._metadata_cache_version += 1
+
+        if self._metadata_cache is not None:
+            self._metadata_cache.clear()
+
+    def _invoke(self, typeOfT: Optional[Type[T]], method: str, relative_url: str, accept_header_value: Optional[str], content_type_value: Optional[str], content: Union[None, str, bytes, Iterable[bytes], AsyncIterable[bytes]]) -> T:
+
+        # the generated methods append the query separator even if none of their optional query parameters is set
+        relative_url = relative_url.removesuffix("?")
+
+        if self._metadata_cache is not None:
+
+            if method == "GET":
+
+                if typeOfT is not Response and _metadata_urls.match(relative_url):
+                    return self._invoke_cached(cast(Type[T], typeOfT), relative_url, accept_header_value)
+
+            # any other request may modify the metadata
+            elif not _read_only_urls.match(relative_url):
+                self.invalidate_metadata_cache()
+
+        # prepare request
+        request = self._build_request_message(method, relative_url, content, content_type_value, accept_header_value)
+
+        # send request
+        response = self._http_client.send(request)
+
+        # process response
+        try:
+
+            if not response.is_success:
+                raise _to_nexus_exception(response)
+
+            # any other successful request may have modified the catalogs
+            if method != "GET" and not _read_only_urls.match(relative_url):
+                self.invalidate_catalog_cache()
+
+            if typeOfT is type(None):
+                return cast(T, type(None))
+
+            # the caller takes ownership of the response
+            elif typeOfT is Response:
+                return cast(T, response)
+
+            else:
+                return _decode_content(cast(Type[T], typeOfT), response.content)
+
+        finally:
+            if typeOfT is not Response or not response.is_success:
+                response.close()
+
+    def _invoke_cached(self, typeOfT: Type[T], relative_url: str, accept_header_value: Optional[str]) -> T:
+
+        metadata_cache = cast(dict[str, tuple[float, float, bytes]], self._metadata_cache)
+        entry = metadata_cache.get(relative_url)
+
+        # there is no event loop to revalidate stale bodies in the background, so they are refetched
+        if entry is None or time.monotonic() >= entry[0]:
+            content = self._fetch_cached(relative_url, accept_header_value)
+
+        else:
+            content = entry[2]
+
+        # the body is decoded on every call so that callers never share mutable objects
+        return _decode_content(typeOfT, content)
+
+    def _fetch_cached(self, relative_url: str, accept_header_value: Optional[str]) -> bytes:
+
+        metadata_cache = cast(dict[str, tuple[float, float, bytes]], self._metadata_cache)
+        version = self._metadata_cache_version
+        request = self._build_request_message("GET", relative_url, None, None, accept_header_value)
+        response = self._http_client.send(request)
+
+        try:
+
+            if not response.is_success:
+                raise _to_nexus_exception(response)
+
+            content = response.content
+            (max_age, stale_period) = _get_cache_lifetime(response)
+
+        finally:
+            response.close()
+
+        # the response is outdated if the cache has been invalidated in the meantime
+        if version == self._metadata_cache_version:
+
+            metadata_cache.pop(relative_url, None)
+
+            if max_age > 0:
+                now = time.monotonic()
+                metadata_cache[relative_url] = (now + max_age, now + max_age + stale_period, content)
+
+        return content
+
+    @contextmanager
+    def _invoke_stream(self, method: str, relative_url: str, accept_header_value: Optional[str]) -> Iterator[Response]:
+
+        headers = { "Accept": accept_header_value } if accept_header_value is not None else None
+
+        # the response is released when the context exits
+        with self._http_client.stream(method, relative_url, headers=headers) as response:
+
+            if not response.is_success:
+                response.read()
+                raise _to_nexus_exception(response)
+
+            yield response
+
+    def _build_request_message(self, method: str, relative_url: str, content: Any, content_type_value: Optional[str], accept_header_value: Optional[str]) -> Request:
+
+        # headers are merged with the client headers once while the request is built
+        headers: dict[str, str] = {}
+
+        if content_type_value is not None:
+            headers["Content-Type"] = content_type_value
+
+        if accept_header_value is not None:
+            headers["Accept"] = accept_header_value
+
+        request_message = self._http_client.build_request(method, relative_url, content = content, headers = headers)
+
+        return request_message
+
+    # "disposable" methods
+    def __enter__(self) -> NexusClient:
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP client and its connection pool, which is shared by all sub-clients."""
+
+        if (self._http_client is not None):
+            self._http_client.close()
+
+    # returns the DataResponse subclass with numpy values, see DataResponse
+    def load( # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        begin: datetime,
+        end: datetime,
+        resource_paths: Iterable[str],
+        on_progress: Optional[Callable[[float], None]]) -> dict[str, DataResponse]:
+        """This high-level methods simplifies loading multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            resource_paths: The resource paths.
+            onProgress: A callback which accepts the current progress.
+        """
+
+        # duplicate paths would be searched and downloaded multiple times
+        unique_resource_paths = list(dict.fromkeys(resource_paths))
+
+        catalog_item_map = self._search_catalog_items_cached(unique_resource_paths)
+        result: dict[str, DataResponse] = {}
+        count = len(catalog_item_map)
+
+        # the requests are latency-bound, so they are sent concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(_load_concurrency, count))) as executor:
+
+            futures = [
+                executor.submit(self._load_one, resource_path, catalog_item, begin, end)
+                for (resource_path, catalog_item) in catalog_item_map.items()
+            ]
+
+            try:
+
+                for (completed, future) in enumerate(as_completed(futures), 1):
+
+                    future.result()
+
+                    if on_progress is not None:
+                        on_progress(completed / count)
+
+            except:
+
+                for future in futures:
+                    future.cancel()
+
+                raise
+
+        # keep the order of the catalog item map
+        for (resource_path, future) in zip(catalog_item_map.keys(), futures):
+            result[resource_path] = future.result()
+
+        return result
+
+    def _load_one(self, resource_path: str, catalog_item: CatalogItem, begin: datetime, end: datetime) -> DataResponse:
+
+        (method, url, accept) = cast(_RecordedRequest, _data_requests.get_stream(resource_path, begin, end))
+
+        with self._invoke_stream(method, url, accept) as response:
+            double_data = self._read_as_double(response)
+
+        (unit, description) = _get_unit_and_description(catalog_item)
+
+        return DataResponse(
+            catalog_item=catalog_item,
+            name=catalog_item.resource.id,
+            unit=unit,
+            description=description,
+            sample_period=catalog_item.representation.sample_period,
+            values=double_data
+        )
+
+    def _search_catalog_items_cached(self, resource_paths: list[str]) -> dict[str, CatalogItem]:
+
+        key = frozenset(resource_paths)
+        now = time.monotonic()
+        entry = self._catalog_cache.pop(key, None)
+
+        if entry is None or now - entry[0] >= _catalog_cache_ttl:
+            entry = (now, self.catalogs.search_catalog_items(resource_paths))
+
+        # re-insert to keep the most recently used entry last
+        self._catalog_cache[key] = entry
+
+        if len(self._catalog_cache) > _catalog_cache_size:
+            del self._catalog_cache[next(iter(self._catalog_cache))]
+
+        return entry[1]
+
+    # returns a numpy array, see DataResponse
+    def _read_as_double(self, response: Response): # pyright: ignore[reportIncompatibleMethodOverride]
+
+        length = _get_identity_content_length(response)
+
+        # unknown length: buffer the whole body in a bytearray so that the array is writable
+        # like the one which is filled in place below
+        if length is None:
+
+            byteBuffer = bytearray()
+
+            for chunk in response.iter_bytes():
+                byteBuffer += chunk
+
+            if len(byteBuffer) % 8 != 0:
+                raise NexusException("N01", "The data length is invalid.")
+
+            doubleBuffer = np.frombuffer(byteBuffer, dtype="<f8")
+
+            return doubleBuffer
+
+        # known length: copy the chunks directly into the target buffer
+        if length == 0:
+            return np.empty(0, dtype="<f8")
+
+        if length % 8 != 0:
+            raise NexusException("N01", "The data length is invalid.")
+
+        doubleBuffer = np.empty(length // 8, dtype="<f8")
+        byteBuffer = doubleBuffer.view(np.uint8).data
+        offset = 0
+
+        for chunk in response.iter_bytes():
+
+            next_offset = offset + len(chunk)
+
+            if next_offset > length:
+                raise NexusException("N01", "The data length is invalid.")
+
+            byteBuffer[offset:next_offset] = chunk
+            offset = next_offset
+
+        if offset != length:
+            raise NexusException("N01", "The data length is invalid.")
+
+        return doubleBuffer
+
+    def export(
+        self,
+        begin: datetime,
+        end: datetime,
+        file_period: timedelta,
+        file_format: Optional[str],
+        resource_paths: Iterable[str],
+        configuration: dict[str, object],
+        target_folder: str,
+        on_progress: Optional[Callable[[float, str], None]]) -> None:
+        """This high-level methods simplifies exporting multiple resources at once.
+
+        Args:
+            begin: Start date/time.
+            end: End date/time.
+            filePeriod: The file period. Use timedelta(0) to get a single file.
+            fileFormat: The target file format. If null, data will be read (and possibly cached) but not returned. This is useful for data pre-aggregation.
+            resource_paths: The resource paths to export.
+            configuration: The configuration.
+            targetFolder: The target folder for the files to extract.
+            onProgress: A callback which accepts the current progress and the progress message.
+        """
+
+        export_parameters = ExportParameters(
+            begin,
+            end,
+            file_period,
+            file_format,
+            list(resource_paths),
+            configuration
+        )
+
+        # Start job
+        job = self.jobs.export(export_parameters)
+
+        # Wait for job to finish
+        artifact_id: Optional[str] = None
+        delay = _job_status_min_delay
+
+        while True:
+            time.sleep(delay)
+            delay = min(delay * 1.5, _job_status_max_delay)
+
+            job_status = self.jobs.get_job_status(job.id)
+
+            if (job_status.status == TaskStatus.CANCELED):
+                raise Exception("The job has been cancelled.")
+
+            elif (job_status.status == TaskStatus.FAULTED):
+                raise Exception(f"The job has failed. Reason: {job_status.exception_message}")
+
+            elif (job_status.status == TaskStatus.RAN_TO_COMPLETION):
+
+                if (job_status.result is not None and \
+                    type(job_status.result) == str):
+
+                    artifact_id = cast(Optional[str], job_status.result)
+
+                    break
+
+            if job_status.progress < 1 and on_progress is not None:
+                on_progress(job_status.progress, "export")
+
+        if on_progress is not None:
+            on_progress(1, "export")
+
+        if artifact_id is None:
+            raise Exception("The job result is invalid.")
+
+        if file_format is None:
+            return
+
+        # Download zip file
+        with ExitStack() as stack:
+
+            (method, url, accept) = cast(_RecordedRequest, _artifacts_requests.download(artifact_id))
+
+            with self._invoke_stream(method, url, accept) as response:
+
+                length = _get_identity_content_length(response)
+
+                # small archives are kept in memory, all others are spooled to an anonymous temporary file
+                target_stream = stack.enter_context(
+                    BytesIO() if length is not None and length <= _artifact_memory_limit else TemporaryFile())
+
+                consumed = 0.0
+
+                for data in response.iter_bytes(_download_chunk_size):
+
+                    target_stream.write(data)
+                    consumed += len(data)
+
+                    if length is not None and on_progress is not None:
+                        if consumed < length:
+                            on_progress(consumed / length, "download")
+
+            if on_progress is not None:
+                on_progress(1, "download")
+
+            # Extract file
+            with ZipFile(target_stream, "r") as zipFile:
+                zipFile.extractall(target_folder)
+
+        if on_progress is not None:
+            on_progress(1, "extract")
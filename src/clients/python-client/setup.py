@@ -47,6 +47,11 @@ setuptools.setup(
     },
     python_requires=">=3.9",
     install_requires=[
-        "httpx>=0.22.0"
-    ]
+        "httpx>=0.22.0",
+        "numpy>=1.20.0"
+    ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.22.0"],
+        "orjson": ["orjson>=3.0.0"]
+    }
 )
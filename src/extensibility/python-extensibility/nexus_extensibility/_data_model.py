@@ -5,7 +5,7 @@ import enum
 import re
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, ClassVar, Optional, Pattern
+from typing import Any, Callable, ClassVar, Match, Optional, Pattern
 
 from ._data_model_extensions import to_unit_string
 from ._data_model_utilities import _get_representation_parameter_string
@@ -77,8 +77,9 @@ class CatalogItem:
         """
         Construct a fully qualified path.
         """
-        parameter_string = _get_representation_parameter_string(self.parameters)
-        return f"{self.catalog.id}/{self.resource.id}/{self.representation.id}{parameter_string}"
+        # no parameters means no suffix (instead of "None")
+        parameter_string = _get_representation_parameter_string(self.parameters) or ""
+        return f"{self.catalog.id}/{self.resource.id}/{to_unit_string(self.representation.sample_period)}{parameter_string}"
 
 @dataclass(frozen=True)
 class CatalogRegistration:
@@ -87,15 +88,17 @@ class CatalogRegistration:
     """
 
     def __post_init__(self):
-        # path
+        # path (the root path is always valid)
         current_path = self.path
 
+        if current_path == "/":
+            return
+
         if not current_path.startswith("/"):
             current_path = "/" + current_path
 
-        if self.path != "/":
-            if not ResourceCatalog.valid_id_expression.match(current_path):
-                raise Exception(f"The catalog path {self.path} is not valid.")
+        if not ResourceCatalog._valid_id_match(current_path):
+            raise Exception(f"The catalog path {self.path} is not valid.")
 
     path: str
     """The absolute or relative path of the catalog."""
@@ -108,7 +111,11 @@ class CatalogRegistration:
 
 ################# DATA MODEL ###############
 
-_nexus_data_type_values: set[int] = set(item.value for item in NexusDataType) 
+# resource and representation argument identifiers share this pattern
+_id_pattern: str = r"[a-zA-Z_][a-zA-Z_0-9]*"
+
+# the low byte of a data type holds its size in bits
+_element_sizes: dict[int, int] = { data_type.value: (data_type.value & 0xFF) >> 3 for data_type in NexusDataType }
 
 @dataclass(frozen=True)
 class Representation:
@@ -116,9 +123,14 @@ class Representation:
     A representation is part of a resource.
     """
 
+    # resources and arguments have the same requirements regarding their IDs, so the NUL-separated
+    # argument IDs are validated by a single match against the repeated resource ID pattern
+    _valid_parameter_ids_match: ClassVar[Callable[[str], Optional[Match[str]]]] = \
+        re.compile(rf"{_id_pattern}(?:\x00{_id_pattern})*").fullmatch
+
     def __post_init__(self):
-        # data type
-        if not self.data_type in _nexus_data_type_values:
+        # data type (the enum's own value lookup table also accepts plain int values)
+        if not self.data_type in NexusDataType._value2member_map_:
             raise Exception(f"The data type {self.data_type} is not valid.")
 
         # sample period
@@ -146,15 +158,18 @@ class Representation:
     @property
     def element_size(self) -> int:
         """The number of bits per element."""
-        return (int(self.data_type) & 0xFF) >> 3
+        return _element_sizes[self.data_type]
 
     def _validate_parameters(self, parameters: dict[str, Any]):
 
-        for key in parameters.keys():
+        if not parameters:
+            return
+
+        joined_keys = "\x00".join(parameters.keys())
 
-            # resources and arguments have the same requirements regarding their IDs
-            if not Resource.valid_id_expression.match(key):
-                raise Exception("The representation argument identifier is not valid.")
+        # the separator count ensures that no key contains the separator itself
+        if not Representation._valid_parameter_ids_match(joined_keys) or joined_keys.count("\x00") != len(parameters) - 1:
+            raise Exception("The representation argument identifier is not valid.")
 
 @dataclass(frozen=True)
 class Resource:
@@ -162,9 +177,12 @@ class Resource:
     A resource is part of a resource catalog and holds a list of representations.
     """
 
-    valid_id_expression : ClassVar[Pattern[str]] = re.compile(r"[a-zA-Z_][a-zA-Z_0-9]*$")
+    valid_id_expression : ClassVar[Pattern[str]] = re.compile(_id_pattern + "$")
     """Gets a regular expression to validate a resource identifier."""
 
+    # bound once to keep the attribute lookups out of the validation
+    _valid_id_match: ClassVar[Callable[[str], Optional[Match[str]]]] = valid_id_expression.match
+
     invalid_id_chars_expression : ClassVar[Pattern[str]] = re.compile(r"[^a-zA-Z_0-9]")
     """Gets a regular expression to find invalid characters in a resource identifier."""
 
@@ -172,7 +190,7 @@ class Resource:
     """Gets a regular expression to find invalid start characters in a resource identifier."""
 
     def __post_init__(self):
-        if not Resource.valid_id_expression.match(self.id):
+        if not Resource._valid_id_match(self.id):
             raise Exception(f"The resource catalog identifier {self.id} is not valid.")
 
         if self.representations is not None:
@@ -188,10 +206,14 @@ class Resource:
     """Gets list of representations."""
 
     def _validate_representations(self, representations: list[Representation]):
-        unique_ids = set([representation.id for representation in representations])
+        unique_ids: set[str] = set()
+
+        for representation in representations:
+
+            if representation.id in unique_ids:
+                raise Exception("There are multiple representations with the same identifier.")
 
-        if len(unique_ids) != len(representations):
-            raise Exception("There are multiple representations with the same identifier.")
+            unique_ids.add(representation.id)
 
 @dataclass(frozen=True)
 class ResourceCatalog:
@@ -202,8 +224,11 @@ class ResourceCatalog:
     valid_id_expression : ClassVar[Pattern[str]] = re.compile(r"(?:\/[a-zA-Z_][a-zA-Z_0-9]*)+$")
     """Gets a regular expression to validate a resource catalog identifier."""
 
+    # bound once to keep the attribute lookups out of the validation
+    _valid_id_match: ClassVar[Callable[[str], Optional[Match[str]]]] = valid_id_expression.match
+
     def __post_init__(self):
-        if not ResourceCatalog.valid_id_expression.match(self.id):
+        if not ResourceCatalog._valid_id_match(self.id):
             raise Exception(f"The resource catalog identifier {self.id} is not valid.")
 
         if self.resources is not None:
@@ -219,10 +244,14 @@ class ResourceCatalog:
     """Gets the list of resources."""
 
     def _validate_resources(self, resources: list[Resource]):
-        unique_ids = set([resource.id for resource in resources])
+        unique_ids: set[str] = set()
+
+        for resource in resources:
+
+            if resource.id in unique_ids:
+                raise Exception("There are multiple resource with the same identifier.")
 
-        if len(unique_ids) != len(resources):
-            raise Exception("There are multiple resource with the same identifier.")
+            unique_ids.add(resource.id)
 
 class ResourceCatalogBuilder:
     """
@@ -298,10 +327,10 @@ class ResourceCatalogBuilder:
         """
 
         if self._resources is None:
-            self._resources = []
+            self._resources = list(resources)
 
-        for resource in resources:
-            self._resources.append(resource)
+        else:
+            self._resources.extend(resources)
 
         return self
 
@@ -403,10 +432,10 @@ class ResourceBuilder:
         """
 
         if self._representations is None:
-            self._representations = []
+            self._representations = list(representations)
 
-        for representation in representations:
-            self._representations.append(representation)
+        else:
+            self._representations.extend(representations)
 
         return self
 
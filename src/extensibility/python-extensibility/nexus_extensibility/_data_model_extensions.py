@@ -1,8 +1,8 @@
+import functools
 from datetime import timedelta
 
-_quotients = [1000, 1000, 60, 1 ]
-_post_fixes = ["us", "ms", "s", "min"]
-
+# there are only a few distinct sample periods, so their unit strings are cached
+@functools.lru_cache(maxsize=256)
 def to_unit_string(sample_period: timedelta) -> str:
     """
     Converts period into a human readable number string with unit.
@@ -11,16 +11,20 @@ def to_unit_string(sample_period: timedelta) -> str:
         sample_period: The period to convert.
     """
 
-    current_value = sample_period.total_seconds() * 1e6
-    
-    for i in range(len(_post_fixes)):
+    # integer microseconds avoid the rounding errors of total_seconds()
+    microseconds = (sample_period.days * 86400 + sample_period.seconds) * 1000000 + sample_period.microseconds
+
+    if microseconds % 1000 != 0:
+        return f"{microseconds}_us"
+
+    milliseconds = microseconds // 1000
 
-        quotient, remainder = divmod(current_value, _quotients[i])
+    if milliseconds % 1000 != 0:
+        return f"{milliseconds}_ms"
 
-        if remainder != 0:
-            return f"{str(int(current_value))}_{_post_fixes[i]}"
+    seconds = milliseconds // 1000
 
-        else:
-            current_value = quotient
+    if seconds % 60 != 0:
+        return f"{seconds}_s"
 
-    return f"{str(int(current_value))}_{_post_fixes[-1]}"
\ No newline at end of file
+    return f"{seconds // 60}_min"
\ No newline at end of file
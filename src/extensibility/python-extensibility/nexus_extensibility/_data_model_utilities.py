@@ -6,7 +6,7 @@ def _get_representation_parameter_string(parameters: Optional[Dict[str, str]]) -
     if (parameters is None):
         return None
 
-    serialized_parameters = (f"{parameter[0]}={parameter[1]}" for parameter in parameters.items())
+    serialized_parameters = [f"{key}={value}" for key, value in parameters.items()]
     parameter_string = f"({','.join(serialized_parameters)})"
 
     return parameter_string
\ No newline at end of file
@@ -33,11 +33,35 @@ class LogLevel(enum.IntEnum):
     """Logs that describe an unrecoverable application or system crash, or a catastrophic failure that requires immediate attention."""
 
 class ILogger(ABC):
+    """
+    A logger. Messages which are expensive to build should be guarded by is_enabled or passed to log_lazy.
+    """
 
     @abstractmethod
     def log(self, log_level: LogLevel, message: str):
         pass
 
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        """
+        Checks if messages of the specified level are logged. Loggers which know their minimum level should override this method.
+
+        Args:
+            log_level: The log level.
+        """
+        return True
+
+    def log_lazy(self, log_level: LogLevel, message: str, *args: Any):
+        """
+        Logs a %-style message which is only formatted if the level is enabled.
+
+        Args:
+            log_level: The log level.
+            message: The message, optionally with %-style placeholders.
+            args: The arguments for the placeholders.
+        """
+        if self.is_enabled(log_level):
+            self.log(log_level, message % args if args else message)
+
 @dataclass(frozen=True)
 class DataSourceContext:
     """
@@ -50,6 +74,9 @@ class DataSourceContext:
         request_configuration: The request configuration.
     """
 
+    # no per-instance __dict__ (dataclass(slots=True) requires Python 3.10)
+    __slots__ = ("resource_locator", "system_configuration", "source_configuration", "request_configuration")
+
     resource_locator: Optional[ParseResult]
     """The unique identifier of the package reference."""
 
@@ -62,6 +89,15 @@ class DataSourceContext:
     request_configuration: Optional[Dict[str, Any]]
     """The request configuration."""
 
+    def __getstate__(self) -> Dict[str, Any]:
+        return { name: getattr(self, name) for name in self.__slots__ }
+
+    def __setstate__(self, state: Dict[str, Any]):
+
+        # the default implementation uses setattr, which is rejected by frozen dataclasses
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
 @dataclass(frozen=True)
 class ReadRequest:
     """
@@ -73,6 +109,9 @@ class ReadRequest:
         status: The status buffer. A value of 0x01 ('1') indicates that the corresponding value in the data buffer is valid, otherwise it is treated as float("NaN").
     """
 
+    # no per-instance __dict__ (dataclass(slots=True) requires Python 3.10)
+    __slots__ = ("catalog_item", "data", "status")
+
     catalog_item: CatalogItem
     """The CatalogItem to be read."""
 
@@ -82,6 +121,15 @@ class ReadRequest:
     status: memoryview
     """The status buffer. A value of 0x01 ('1') indicates that the corresponding value in the data buffer is valid, otherwise it is treated as float("NaN")."""
 
+    def __getstate__(self) -> Dict[str, Any]:
+        return { name: getattr(self, name) for name in self.__slots__ }
+
+    def __setstate__(self, state: Dict[str, Any]):
+
+        # the default implementation uses setattr, which is rejected by frozen dataclasses
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
 class ReadDataHandler(Protocol):
     """
     A handler to read data.
@@ -101,6 +149,10 @@ class ReadDataHandler(Protocol):
 
 ################# DATA SOURCE ###############
 
+# immutable defaults shared by all calls
+_DEFAULT_TIME_RANGE: Tuple[datetime, datetime] = (datetime.min, datetime.max)
+_DEFAULT_AVAILABILITY = float("NaN")
+
 class IDataSource(IExtension, ABC):
     """
     A data source.
@@ -203,10 +255,10 @@ class SimpleDataSource(IDataSource, ABC):
         pass
 
     async def get_time_range(self, catalog_id: str) -> Tuple[datetime, datetime]:
-        return (datetime.min, datetime.max)
+        return _DEFAULT_TIME_RANGE
 
     async def get_availability(self, catalog_id: str, begin: datetime, end: datetime) -> float:
-        return float("NaN")
+        return _DEFAULT_AVAILABILITY
 
     @abstractmethod
     def read(
@@ -1,9 +1,38 @@
+import asyncio
+import mmap
 from abc import ABC
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Any, Dict, List, Literal, Tuple
 
-from ._data_model import Representation
+from ._data_model import NexusDataType, Representation
+from ._extensibility_data_source import ReadDataHandler, ReadRequest
 
+# struct format characters of the Nexus data types (native byte order)
+_BufferFormat = Literal["B", "b", "H", "h", "I", "i", "Q", "q", "f", "d"]
+
+_buffer_formats: dict[int, _BufferFormat] = {
+    NexusDataType.UINT8:    "B",
+    NexusDataType.INT8:     "b",
+    NexusDataType.UINT16:   "H",
+    NexusDataType.INT16:    "h",
+    NexusDataType.UINT32:   "I",
+    NexusDataType.INT32:    "i",
+    NexusDataType.UINT64:   "Q",
+    NexusDataType.INT64:    "q",
+    NexusDataType.FLOAT32:  "f",
+    NexusDataType.FLOAT64:  "d"
+}
+
+# buffers of at least this size (in bytes) are mapped from the OS which provides zeroed pages on demand
+_mmap_threshold = 1024 * 1024
+
+def _allocate_buffer(size: int) -> memoryview:
+
+    # anonymous mappings need no zeroing pass, only touched pages are committed
+    if size >= _mmap_threshold:
+        return memoryview(mmap.mmap(-1, size))
+
+    return memoryview(bytearray(size))
 
 class ExtensibilityUtilities(ABC):
 
@@ -11,11 +40,84 @@ class ExtensibilityUtilities(ABC):
     def create_buffers(representation: Representation, begin: datetime, end: datetime) -> Tuple[memoryview, memoryview]:
         element_count = ExtensibilityUtilities._calculate_element_count(begin, end, representation.sample_period)
 
-        data = bytearray(element_count * representation.element_size)
-        status = bytearray(element_count)
+        data = _allocate_buffer(element_count * representation.element_size)
+        status = _allocate_buffer(element_count)
+
+        return (data, status)
+
+    @staticmethod
+    def create_batched_buffers(representations: List[Representation], begin: datetime, end: datetime) -> List[Tuple[memoryview, memoryview]]:
+        """
+        Creates the data and status buffers for a number of representations as slices of two contiguous buffers.
+        This requires two allocations in total instead of two per representation.
+
+        Args:
+            representations: The representations.
+            begin: The beginning of the period.
+            end: The end of the period.
+        """
+        layout: List[Tuple[int, int, int]] = []
+        data_size = 0
+        status_size = 0
+
+        for representation in representations:
+            element_count = ExtensibilityUtilities._calculate_element_count(begin, end, representation.sample_period)
+            layout.append((data_size, status_size, element_count))
+
+            # keep each data slice aligned to 8 bytes so that it can be cast to any element type
+            data_size += -(-element_count * representation.element_size // 8) * 8
+            status_size += element_count
+
+        data = _allocate_buffer(data_size)
+        status = _allocate_buffer(status_size)
+
+        return [
+            (data[data_offset:data_offset + element_count * representation.element_size], status[status_offset:status_offset + element_count])
+            for representation, (data_offset, status_offset, element_count) in zip(representations, layout)
+        ]
+
+    @staticmethod
+    def cast_data(request: ReadRequest) -> "memoryview[Any]":
+        """
+        Casts the data buffer of the read request to the element type of its representation.
+        The returned view can be indexed directly or wrapped without copying, e.g. via numpy.asarray().
+
+        Args:
+            request: The read request.
+        """
+        data_type = request.catalog_item.representation.data_type
+        return request.data.cast(_buffer_formats[data_type])
+
+    @staticmethod
+    def group_requests(requests: List[ReadRequest]) -> Dict[Tuple[str, timedelta], List[ReadRequest]]:
+        """
+        Groups the read requests by catalog identifier and sample period while preserving their order.
+        A data source can then process each group at once, e.g. by reading a file only once for all requests of a group.
+
+        Args:
+            requests: The read requests.
+        """
+        groups: Dict[Tuple[str, timedelta], List[ReadRequest]] = {}
+
+        for request in requests:
+            catalog_item = request.catalog_item
+            key = (catalog_item.catalog.id, catalog_item.representation.sample_period)
+            groups.setdefault(key, []).append(request)
+
+        return groups
+
+    @staticmethod
+    async def gather_read_data(read_data: ReadDataHandler, specs: List[Tuple[str, datetime, datetime]]) -> List[memoryview]:
+        """
+        Reads the data of a number of resources concurrently instead of awaiting each read in turn.
 
-        return (memoryview(data), memoryview(status))
+        Args:
+            read_data: The handler to read data from Nexus as passed to IDataSource.read.
+            specs: The resource paths and the begin and end date/times to read.
+        """
+        return list(await asyncio.gather(*[read_data(resource_path, begin, end) for (resource_path, begin, end) in specs]))
 
     @staticmethod
     def _calculate_element_count(begin: datetime, end: datetime, sample_period: timedelta) -> int:
-        return int((end - begin).total_seconds() / sample_period.total_seconds())
+        # timedelta floor division is exact integer arithmetic on microseconds
+        return (end - begin) // sample_period
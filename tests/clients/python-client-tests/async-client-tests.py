@@ -1,43 +1,142 @@
+import asyncio
 import base64
 import json
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from uuid import UUID
+from zipfile import ZipFile
 
 import pytest
 from httpx import AsyncClient, MockTransport, Request, Response, codes
-from nexus_api import NexusAsyncClient
+from nexus_api import NexusAsyncClient, NexusException, TaskStatus
 
 nexus_configuration_header_key = "Nexus-Configuration"
 
-try_count: int = 0
+configuration = {
+    "foo1": "bar1",
+    "foo2": "bar2"
+}
 
-def _handler(request: Request):
-    global try_count
+catalog_json = b'{"Id":"my-catalog-id","Properties":null,"Resources":null}'
 
-    if "catalogs" in request.url.path:
-        try_count += 1
+time_range_json = b'{"Begin":"2020-01-01T00:00:00Z","End":"2020-01-02T00:00:00Z"}'
 
-        if (try_count == 1):
-            assert not nexus_configuration_header_key in request.headers
+writer_descriptions_json = b'[{"Type":"Csv","Version":"1.0.0","Description":null,"ProjectUrl":null,"RepositoryUrl":null,"AdditionalInformation":{"Label":"CSV"}}]'
 
-        elif (try_count == 2):
+expected_configuration_header = base64.b64encode(json.dumps(configuration, separators=(",", ":")).encode("utf-8")).decode("utf-8")
 
-            configuration = {
-                "foo1": "bar1",
-                "foo2": "bar2"
-            }
+@dataclass
+class _HandlerState:
+    try_count: int = 0
 
-            expected = base64.b64encode(json.dumps(configuration).encode("utf-8")).decode("utf-8")
-            actual = request.headers[nexus_configuration_header_key]
+def _create_handler(state: _HandlerState):
 
-            assert expected == actual
+    # the request count is tracked per test instead of in a module global
+    def _handler(request: Request):
 
-        elif (try_count == 3):
-            assert not nexus_configuration_header_key in request.headers
+        if "catalogs" in request.url.path:
+            state.try_count += 1
 
-        catalog_json_string = '{"Id":"my-catalog-id","Properties":null,"Resources":null}'
-        return Response(codes.OK, content=catalog_json_string)
+            if (state.try_count == 1):
+                assert not nexus_configuration_header_key in request.headers
 
-    else:
-        raise Exception("Unsupported path.")
+            elif (state.try_count == 2):
+                actual = request.headers[nexus_configuration_header_key]
+                assert expected_configuration_header == actual
+
+            elif (state.try_count == 3):
+                assert not nexus_configuration_header_key in request.headers
+
+            return Response(codes.OK, content=catalog_json)
+
+        else:
+            raise Exception("Unsupported path.")
+
+    return _handler
+
+def _create_metadata_handler(requests: list[str]):
+
+    def _handler(request: Request):
+
+        requests.append(f"{request.method} {request.url.path}")
+
+        if request.url.path == "/api/v1/system/configuration":
+
+            if request.method == "GET":
+                return Response(codes.OK, json={"foo": ["bar"]}, headers={"Cache-Control": "max-age=60"})
+
+            else:
+                return Response(codes.OK)
+
+        elif request.url.path == "/api/v1/catalogs/my-catalog-id/timerange":
+            return Response(codes.OK, content=time_range_json, headers={"Cache-Control": "no-store"})
+
+        elif request.url.path == "/api/v1/writers/descriptions":
+            return Response(codes.OK, content=writer_descriptions_json)
+
+        elif request.url.path == "/api/v1/catalogs/search-items":
+            return Response(codes.OK, json={})
+
+        else:
+            raise Exception("Unsupported path.")
+
+    return _handler
+
+def _create_catalog_item_json(resource_path: str):
+
+    return {
+        "Catalog": { "Id": "/A", "Properties": None, "Resources": None },
+        "Resource": { "Id": resource_path.split("/")[2], "Properties": None, "Representations": None },
+        "Representation": { "DataType": "FLOAT64", "SamplePeriod": "00:00:01", "Parameters": None },
+        "Parameters": None
+    }
+
+def _create_search_items_handler(requests: list[list[str]], status_code: int = codes.OK):
+
+    def _handler(request: Request):
+
+        if request.url.path == "/api/v1/catalogs/search-items":
+
+            resource_paths = json.loads(request.content)
+            requests.append(resource_paths)
+
+            if status_code != codes.OK:
+                return Response(status_code, text="Search failed.")
+
+            return Response(codes.OK, json={
+                resource_path: _create_catalog_item_json(resource_path)
+                for resource_path in resource_paths
+                if not "missing" in resource_path
+            })
+
+        else:
+            raise Exception("Unsupported path.")
+
+    return _handler
+
+def _create_load_handler(requests: list[list[str]]):
+
+    def _handler(request: Request):
+
+        if request.url.path == "/api/v1/catalogs/search-items":
+
+            resource_paths = json.loads(request.content)
+            requests.append(resource_paths)
+
+            return Response(codes.OK, json={
+                resource_path: _create_catalog_item_json(resource_path)
+                for resource_path in resource_paths
+            })
+
+        elif request.url.path == "/api/v1/data":
+            return Response(codes.OK, content=bytes(8))
+
+        else:
+            raise Exception("Unsupported path.")
+
+    return _handler
 
 @pytest.mark.asyncio
 async def can_add_configuration_test():
@@ -45,12 +144,7 @@ async def can_add_configuration_test():
     # arrange
     catalog_id = "my-catalog-id"
 
-    configuration = {
-        "foo1": "bar1",
-        "foo2": "bar2"
-    }
-
-    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_handler(_HandlerState())))
 
     async with NexusAsyncClient(http_client) as client:
 
@@ -63,3 +157,708 @@ async def can_add_configuration_test():
         _ = await client.catalogs.get(catalog_id)
 
         # assert (already asserted in _handler)
+
+@pytest.mark.asyncio
+async def can_cache_metadata_test():
+
+    # arrange
+    requests: list[str] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_metadata_handler(requests)))
+
+    async with NexusAsyncClient(http_client, cache_metadata=True) as client:
+
+        # act
+        configuration1 = await client.system.get_configuration()
+        configuration1["foo"].append("baz") # type: ignore
+        configuration2 = await client.system.get_configuration()
+
+        _ = await client.catalogs.get_time_range("my-catalog-id")
+        _ = await client.catalogs.get_time_range("my-catalog-id")
+
+        _ = await client.catalogs.search_catalog_items([])
+        _ = await client.system.get_configuration()
+
+        await client.system.set_configuration(configuration2)
+        _ = await client.system.get_configuration()
+
+        # assert
+        assert configuration2 == {"foo": ["bar"]}
+
+        assert requests == [
+            "GET /api/v1/system/configuration",
+            "GET /api/v1/catalogs/my-catalog-id/timerange",
+            "GET /api/v1/catalogs/my-catalog-id/timerange",
+            "POST /api/v1/catalogs/search-items",
+            "PUT /api/v1/system/configuration",
+            "GET /api/v1/system/configuration"
+        ]
+
+@pytest.mark.asyncio
+async def does_not_cache_metadata_by_default_test():
+
+    # arrange
+    requests: list[str] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_metadata_handler(requests)))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        _ = await client.system.get_configuration()
+        _ = await client.system.get_configuration()
+
+        # assert
+        assert requests == [
+            "GET /api/v1/system/configuration",
+            "GET /api/v1/system/configuration"
+        ]
+
+@pytest.mark.asyncio
+async def can_revalidate_stale_metadata_test():
+
+    # arrange
+    requests: list[str] = []
+
+    def _handler(request: Request):
+
+        requests.append(f"{request.method} {request.url.path}")
+        headers = {"Cache-Control": "max-age=0, stale-while-revalidate=60"}
+
+        return Response(codes.OK, json=f"https://help.example/{len(requests)}", headers=headers)
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+
+    async with NexusAsyncClient(http_client, cache_metadata=True) as client:
+
+        # act
+        help_link1 = await client.system.get_help_link()
+        help_link2 = await client.system.get_help_link()
+
+        # give the background revalidation time to complete
+        await asyncio.sleep(0.1)
+        help_link3 = await client.system.get_help_link()
+
+        # assert
+        assert help_link1 == "https://help.example/1"
+        assert help_link2 == "https://help.example/1"
+        assert help_link3 == "https://help.example/2"
+        assert requests[:2] == ["GET /api/v1/system/help-link", "GET /api/v1/system/help-link"]
+
+@pytest.mark.asyncio
+async def can_cache_writer_descriptions_test():
+
+    # arrange
+    requests: list[str] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_metadata_handler(requests)))
+
+    async with NexusAsyncClient(http_client, cache_metadata=True) as client:
+
+        # act
+        descriptions1 = await client.writers.get_descriptions()
+        descriptions1.clear()
+        descriptions2 = await client.writers.get_descriptions()
+        descriptions2[0].additional_information["Label"] = "TSV" # type: ignore
+        descriptions3 = await client.writers.get_descriptions()
+
+        # assert
+        assert len(descriptions3) == 1
+        assert descriptions3[0].type == "Csv"
+        assert descriptions3[0].additional_information == {"Label": "CSV"}
+        assert requests == ["GET /api/v1/writers/descriptions"]
+
+@pytest.mark.asyncio
+async def can_batch_lookups_test():
+
+    # arrange
+    requests: list[list[str]] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_search_items_handler(requests)))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        catalog_items = await asyncio.gather(
+            client.catalogs.lookup("/A/R1/1_s"),
+            client.catalogs.lookup("/A/R2/1_s"),
+            client.catalogs.lookup("/A/R1/1_s")
+        )
+
+        # assert
+        assert requests == [["/A/R1/1_s", "/A/R2/1_s"]]
+        assert [catalog_item.resource.id for catalog_item in catalog_items] == ["R1", "R2", "R1"]
+
+@pytest.mark.asyncio
+async def lookup_fails_for_all_callers_test():
+
+    # arrange
+    requests: list[list[str]] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_search_items_handler(requests, codes.INTERNAL_SERVER_ERROR)))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        results = await asyncio.gather(
+            client.catalogs.lookup("/A/R1/1_s"),
+            client.catalogs.lookup("/A/R2/1_s"),
+            return_exceptions=True
+        )
+
+        # assert
+        assert len(requests) == 1
+
+        for result in results:
+            assert isinstance(result, NexusException)
+            assert result.status_code == "N00.500"
+
+@pytest.mark.asyncio
+async def lookup_fails_for_missing_catalog_items_test():
+
+    # arrange
+    requests: list[list[str]] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_search_items_handler(requests)))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        (catalog_item, missing) = await asyncio.gather(
+            client.catalogs.lookup("/A/R1/1_s"),
+            client.catalogs.lookup("/A/missing/1_s"),
+            return_exceptions=True
+        )
+
+        # assert
+        assert requests == [["/A/R1/1_s", "/A/missing/1_s"]]
+        assert not isinstance(catalog_item, BaseException) and catalog_item.resource.id == "R1"
+        assert isinstance(missing, NexusException) and missing.status_code == "N01"
+
+@pytest.mark.asyncio
+async def lookup_fails_when_batch_is_cancelled_test():
+
+    # arrange
+    started = asyncio.Event()
+
+    async def _handler(request: Request):
+
+        started.set()
+        await asyncio.Event().wait()
+
+        return Response(codes.OK, json={})
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        lookup = asyncio.ensure_future(client.catalogs.lookup("/A/R1/1_s"))
+        await started.wait()
+
+        # cancel the batch request like an event loop which shuts down
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task() and task is not lookup:
+                task.cancel()
+
+        # assert
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(lookup, 1)
+
+@pytest.mark.asyncio
+async def can_invalidate_catalog_cache_test():
+
+    # arrange
+    requests: list[list[str]] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_load_handler(requests)))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    resource_paths = ["/A/R1/1_s"]
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        _ = await client.load(begin, end, resource_paths, None)
+        _ = await client.load(begin, end, resource_paths, None)
+
+        client.sign_in("my-access-token")
+        _ = await client.load(begin, end, resource_paths, None)
+
+        with client.attach_configuration(configuration):
+            _ = await client.load(begin, end, resource_paths, None)
+
+        _ = await client.load(begin, end, resource_paths, None)
+
+        # assert
+        assert requests == [resource_paths] * 4
+
+@pytest.mark.asyncio
+async def modifying_request_invalidates_catalog_cache_test():
+
+    # arrange
+    requests: list[list[str]] = []
+    load_handler = _create_load_handler(requests)
+    delete_status_codes = [codes.NOT_FOUND, codes.OK]
+
+    def _handler(request: Request):
+
+        if request.method == "DELETE":
+            return Response(delete_status_codes.pop(0))
+
+        else:
+            return load_handler(request)
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    resource_paths = ["/A/R1/1_s"]
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        _ = await client.load(begin, end, resource_paths, None)
+
+        with pytest.raises(NexusException):
+            _ = await client.catalogs.delete_attachment("/A", "my-attachment")
+
+        _ = await client.load(begin, end, resource_paths, None)
+        _ = await client.catalogs.delete_attachment("/A", "my-attachment")
+        _ = await client.load(begin, end, resource_paths, None)
+
+        # assert
+        assert requests == [resource_paths] * 2
+
+@pytest.mark.asyncio
+async def can_get_availability_array_test():
+
+    # arrange
+    requests: list[str] = []
+
+    def _handler(request: Request):
+        requests.append(str(request.url))
+        return Response(codes.OK, json={"Data": [1.0, 0.5]})
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 3, 0, 0, 0, tzinfo=timezone.utc)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        actual = await client.catalogs.get_availability_array("/A", begin, end, timedelta(days=1))
+
+        # assert
+        assert actual.tolist() == [1.0, 0.5]
+        assert requests == ["http://localhost/api/v1/catalogs/%2FA/availability?begin=2020-01-01T00%3A00%3A00%2B00%3A00&end=2020-01-03T00%3A00%3A00%2B00%3A00&step=1%20day%2C%200%3A00%3A00"]
+
+@pytest.mark.parametrize("availability_json", [b'{}', b'{"Data":null}', b'null'], ids=["missing", "null", "none"])
+@pytest.mark.asyncio
+async def get_availability_array_fails_without_data_test(availability_json: bytes):
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(lambda request: Response(codes.OK, content=availability_json)))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 3, 0, 0, 0, tzinfo=timezone.utc)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        with pytest.raises(NexusException) as exception_info:
+            await client.catalogs.get_availability_array("/A", begin, end, timedelta(days=1))
+
+        # assert
+        assert exception_info.value.status_code == "N01"
+
+@pytest.mark.parametrize("chunked", [False, True], ids=["content-length", "chunked"])
+@pytest.mark.asyncio
+async def load_returns_writable_values_test(chunked: bool):
+
+    # arrange
+    data = struct.pack("<2d", 1.0, 2.0)
+
+    async def _iterate_chunks():
+        yield data[:5]
+        yield data[5:]
+
+    def _handler(request: Request):
+
+        if request.url.path == "/api/v1/catalogs/search-items":
+            return Response(codes.OK, json={ "/A/R1/1_s": _create_catalog_item_json("/A/R1/1_s") })
+
+        elif request.url.path == "/api/v1/data":
+            return Response(codes.OK, content=_iterate_chunks() if chunked else data)
+
+        else:
+            raise Exception("Unsupported path.")
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 2, tzinfo=timezone.utc)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        values = (await client.load(begin, end, ["/A/R1/1_s"], None))["/A/R1/1_s"].values
+        values[0] = 3.0
+
+        # assert
+        assert values.flags.writeable
+        assert values.tolist() == [3.0, 2.0]
+
+@pytest.mark.asyncio
+async def load_reports_progress_test():
+
+    # arrange
+    requests: list[list[str]] = []
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_load_handler(requests)))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    resource_paths = ["/A/R1/1_s", "/A/R2/1_s", "/A/R3/1_s"]
+    progress: list[float] = []
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        _ = await client.load(begin, end, resource_paths, progress.append)
+
+        # assert
+        assert progress == [1 / 3, 2 / 3, 1.0]
+
+@pytest.mark.asyncio
+async def load_deduplicates_resource_paths_test():
+
+    # arrange
+    requests: list[list[str]] = []
+    data_requests: list[str] = []
+    load_handler = _create_load_handler(requests)
+
+    def _handler(request: Request):
+
+        if request.url.path == "/api/v1/data":
+            data_requests.append(request.url.params["resourcePath"])
+
+        return load_handler(request)
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        result = await client.load(begin, end, ["/A/R1/1_s", "/A/R2/1_s", "/A/R1/1_s"], None)
+
+        # assert
+        assert list(result.keys()) == ["/A/R1/1_s", "/A/R2/1_s"]
+        assert requests == [["/A/R1/1_s", "/A/R2/1_s"]]
+        assert sorted(data_requests) == ["/A/R1/1_s", "/A/R2/1_s"]
+
+def _create_job_status_json(status: TaskStatus):
+    return { "Start": "2020-01-01T00:00:00Z", "Status": status.value, "Progress": 0.5, "ExceptionMessage": None, "Result": None }
+
+@pytest.mark.asyncio
+async def can_wait_for_job_test():
+
+    # arrange
+    statuses = [TaskStatus.WAITING_TO_RUN, TaskStatus.RUNNING, TaskStatus.RAN_TO_COMPLETION]
+    requests: list[str] = []
+
+    def _handler(request: Request):
+        requests.append(request.url.path)
+        return Response(codes.OK, json=_create_job_status_json(statuses[len(requests) - 1]))
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+    job_id = UUID("00000000-0000-0000-0000-000000000001")
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        job_status = await client.jobs.wait_for_job(job_id)
+
+        # assert
+        assert job_status.status == TaskStatus.RAN_TO_COMPLETION
+        assert requests == [f"/api/v1/jobs/{job_id}/status"] * 3
+
+@pytest.mark.asyncio
+async def wait_for_job_times_out_test():
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(lambda request: Response(codes.OK, json=_create_job_status_json(TaskStatus.RUNNING))))
+    job_id = UUID("00000000-0000-0000-0000-000000000001")
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        with pytest.raises(TimeoutError):
+            await client.jobs.wait_for_job(job_id, timeout=0.2)
+
+def _create_export_handler(requests: list[str], statuses: list[TaskStatus], artifact: bytes):
+
+    job_id = "00000000-0000-0000-0000-000000000001"
+
+    def _handler(request: Request):
+
+        requests.append(f"{request.method} {request.url.path}")
+
+        if request.url.path == "/api/v1/jobs/export":
+            return Response(codes.OK, json={ "Id": job_id, "Type": "export", "Owner": "me", "Parameters": None })
+
+        elif request.url.path == f"/api/v1/jobs/{job_id}/status":
+
+            status = statuses.pop(0)
+            job_status_json = _create_job_status_json(status)
+
+            if status == TaskStatus.RAN_TO_COMPLETION:
+                job_status_json["Result"] = "my-artifact"
+
+            elif status == TaskStatus.FAULTED:
+                job_status_json["ExceptionMessage"] = "my-exception-message"
+
+            return Response(codes.OK, json=job_status_json)
+
+        elif request.url.path == "/api/v1/artifacts/my-artifact":
+            return Response(codes.OK, content=artifact)
+
+        else:
+            raise Exception("Unsupported path.")
+
+    return _handler
+
+def _create_artifact():
+
+    artifact_stream = BytesIO()
+
+    with ZipFile(artifact_stream, "w") as zip_file:
+        zip_file.writestr("data/my-file.csv", "my-content")
+
+    return artifact_stream.getvalue()
+
+@pytest.mark.parametrize("in_memory", [True, False], ids=["in-memory", "temporary-file"])
+@pytest.mark.asyncio
+async def can_export_test(tmp_path, monkeypatch, in_memory: bool):
+
+    # arrange
+    requests: list[str] = []
+    statuses = [TaskStatus.RUNNING, TaskStatus.RUNNING, TaskStatus.RAN_TO_COMPLETION]
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_export_handler(requests, statuses, _create_artifact())))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    delays: list[float] = []
+    progress: list[tuple[float, str]] = []
+
+    async def _sleep(delay: float):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+
+    if not in_memory:
+        monkeypatch.setattr("nexus_api._nexus_api_extensions._artifact_memory_limit", 0)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        await client.export(begin, end, timedelta(0), "csv", ["/A/R1/1_s"], {}, str(tmp_path), lambda value, message: progress.append((value, message)))
+
+        # assert
+        assert (tmp_path / "data" / "my-file.csv").read_text() == "my-content"
+
+        assert requests == \
+            ["POST /api/v1/jobs/export"] + \
+            ["GET /api/v1/jobs/00000000-0000-0000-0000-000000000001/status"] * 3 + \
+            ["GET /api/v1/artifacts/my-artifact"]
+
+        # the job status is polled with exponential backoff
+        assert delays == pytest.approx([0.05, 0.075, 0.1125])
+
+        assert progress == [(0.5, "export"), (0.5, "export"), (1, "export"), (1, "download"), (1, "extract")]
+
+@pytest.mark.asyncio
+async def export_fails_when_job_fails_test(tmp_path, monkeypatch):
+
+    # arrange
+    requests: list[str] = []
+    statuses = [TaskStatus.RUNNING, TaskStatus.FAULTED]
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_create_export_handler(requests, statuses, b"")))
+    begin = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+
+    async def _sleep(delay: float):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        with pytest.raises(Exception, match="my-exception-message"):
+            await client.export(begin, end, timedelta(0), "csv", ["/A/R1/1_s"], {}, str(tmp_path), None)
+
+        # assert
+        assert not any(request.startswith("GET /api/v1/artifacts/") for request in requests)
+        assert list(tmp_path.iterdir()) == []
+
+@pytest.mark.asyncio
+async def can_get_many_test():
+
+    # arrange
+    requests: list[str] = []
+
+    def _handler(request: Request):
+        catalog_id = request.url.path.removeprefix("/api/v1/catalogs/")
+        requests.append(catalog_id)
+        return Response(codes.OK, json={ "Id": catalog_id, "Properties": None, "Resources": None })
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        catalogs = await client.catalogs.get_many(["/B", "/A", "/B", "/C"])
+
+        # assert
+        assert sorted(requests) == ["/A", "/B", "/C"]
+        assert list(catalogs.keys()) == ["/B", "/A", "/C"]
+        assert [catalog.id for catalog in catalogs.values()] == ["/B", "/A", "/C"]
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+@pytest.mark.asyncio
+async def get_many_rejects_invalid_concurrency_test(concurrency: int):
+
+    # arrange
+    def _handler(request: Request):
+        raise Exception("Unexpected request.")
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act / assert
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(client.catalogs.get_many(["/A"], concurrency), 1)
+
+@pytest.mark.asyncio
+async def get_many_cancels_remaining_requests_on_failure_test():
+
+    # arrange
+    requests: list[str] = []
+    canceled: list[str] = []
+
+    async def _handler(request: Request):
+
+        catalog_id = request.url.path.removeprefix("/api/v1/catalogs/")
+        requests.append(catalog_id)
+
+        if catalog_id == "/A":
+            return Response(codes.NOT_FOUND)
+
+        try:
+            await asyncio.sleep(10)
+
+        except asyncio.CancelledError:
+            canceled.append(catalog_id)
+            raise
+
+        return Response(codes.OK, json={ "Id": catalog_id, "Properties": None, "Resources": None })
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        with pytest.raises(NexusException) as exception_info:
+            await client.catalogs.get_many(["/B", "/A", "/C"])
+
+        # let the canceled requests observe their cancellation
+        await asyncio.sleep(0)
+
+        # assert
+        assert exception_info.value.status_code == "N00.404"
+        assert sorted(canceled) == ["/B", "/C"]
+
+@pytest.mark.asyncio
+async def can_get_versions_many_test():
+
+    # arrange
+    requests: list[str] = []
+    package_reference_ids = [UUID(int=2), UUID(int=1), UUID(int=2)]
+
+    def _handler(request: Request):
+        package_reference_id = request.url.path.split("/")[-2]
+        requests.append(package_reference_id)
+        return Response(codes.OK, json=[f"v{UUID(package_reference_id).int}"])
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        versions = await client.package_references.get_versions_many(package_reference_ids)
+
+        # assert
+        assert sorted(requests) == [str(UUID(int=1)), str(UUID(int=2))]
+        assert versions == { UUID(int=2): ["v2"], UUID(int=1): ["v1"] }
+        assert list(versions.keys()) == [UUID(int=2), UUID(int=1)]
+
+@pytest.mark.asyncio
+async def can_upload_attachment_file_test(tmp_path):
+
+    # arrange
+    requests: list[tuple[str, str, bytes]] = []
+
+    async def _handler(request: Request):
+        requests.append((request.method, request.url.raw_path.decode(), await request.aread()))
+        return Response(codes.OK)
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+    path = tmp_path / "attachment.txt"
+    path.write_bytes(b"0123456789")
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        response = await client.catalogs.upload_attachment_file("/A", "attachment.txt", path, chunk_size=4)
+
+        # assert
+        assert response.status_code == codes.OK
+        assert requests == [("PUT", "/api/v1/catalogs/%2FA/attachments/attachment.txt", b"0123456789")]
+
+@pytest.mark.asyncio
+async def can_close_test():
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(lambda request: Response(codes.OK)))
+    client = NexusAsyncClient(http_client)
+
+    # act
+    await client.aclose()
+
+    # assert
+    assert http_client.is_closed
+
+@pytest.mark.asyncio
+async def closes_http_client_on_exit_test():
+
+    # arrange
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(lambda request: Response(codes.OK)))
+
+    # act
+    async with NexusAsyncClient(http_client):
+        pass
+
+    # assert
+    assert http_client.is_closed
+
+@pytest.mark.asyncio
+async def can_upload_sync_iterable_test():
+
+    # arrange
+    requests: list[bytes] = []
+
+    async def _handler(request: Request):
+        requests.append(await request.aread())
+        return Response(codes.OK)
+
+    http_client = AsyncClient(base_url="http://localhost", transport=MockTransport(_handler))
+
+    async with NexusAsyncClient(http_client) as client:
+
+        # act
+        response = await client.catalogs.upload_attachment("/A", "attachment.txt", iter([b"01", b"23"]))
+
+        # assert
+        assert response.status_code == codes.OK
+        assert requests == [b"0123"]
@@ -1,38 +1,35 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import pytest
 from nexus_extensibility import to_unit_string
 
 
 @pytest.mark.parametrize(
-    "sample_period_string, expected", 
+    "sample_period, expected", 
     [
-        ("00:00:00.000001", "1_us"),
-        ("00:00:00.000010", "10_us"),
-        ("00:00:00.000100", "100_us"),
-        ("00:00:00.001500", "1500_us"),
+        (timedelta(microseconds=1), "1_us"),
+        (timedelta(microseconds=10), "10_us"),
+        (timedelta(microseconds=100), "100_us"),
+        (timedelta(microseconds=1500), "1500_us"),
+        (timedelta(microseconds=520500), "520500_us"),
 
-        ("00:00:00.001000", "1_ms"),
-        ("00:00:00.010000", "10_ms"),
-        ("00:00:00.100000", "100_ms"),
-        ("00:00:01.500000", "1500_ms"),
+        (timedelta(milliseconds=1), "1_ms"),
+        (timedelta(milliseconds=10), "10_ms"),
+        (timedelta(milliseconds=100), "100_ms"),
+        (timedelta(milliseconds=1500), "1500_ms"),
 
-        ("00:00:01.000000", "1_s"),
-        ("00:00:15.000000", "15_s"),
+        (timedelta(seconds=1), "1_s"),
+        (timedelta(seconds=15), "15_s"),
 
-        ("00:01:00.000000", "1_min")
-    ])
-def can_create_unit_strings_test(sample_period_string: str, expected: str):
+        (timedelta(hours=1, seconds=1), "3601_s"),
 
-    datetime_tmp = datetime.strptime(sample_period_string, "%H:%M:%S.%f")
+        (timedelta(minutes=1), "1_min"),
+        (timedelta(hours=2), "120_min"),
+        (timedelta(days=1, hours=1), "1500_min")
+    ],
+    ids=["1us", "10us", "100us", "1500us", "520500us", "1ms", "10ms", "100ms", "1500ms", "1s", "15s", "3601s", "1min", "120min", "1500min"])
+def can_create_unit_strings_test(sample_period: timedelta, expected: str):
 
-    timedelta_tmp = timedelta(
-        hours=datetime_tmp.hour, 
-        minutes=datetime_tmp.minute, 
-        seconds=datetime_tmp.second, 
-        microseconds=datetime_tmp.microsecond)
+    actual = to_unit_string(sample_period)
 
-    actual = to_unit_string(timedelta_tmp)
-
-    assert actual == expected
-    
+    assert actual == expected
\ No newline at end of file
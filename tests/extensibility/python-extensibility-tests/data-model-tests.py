@@ -1,73 +1,93 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
+from typing import Any
 
 import pytest
-from nexus_extensibility import (NexusDataType, Representation, Resource,
-                                 ResourceCatalog)
-
-
-@pytest.mark.parametrize(
-    "id, is_valid", 
-    [
-        ("/a", True),
-        ("/_a", True),
-        ("/ab_c", True),
-        ("/a9_b/c__99", True),
-
-        ("", False),
-        ("/", False),
-        ("/a/", False),
-        ("/9", False),
-        ("a", False),
-    ])
-def can_validate_catalog_id_test(id: str, is_valid: bool):
-
-    if is_valid:
+from nexus_extensibility import (CatalogItem, NexusDataType, Representation,
+                                 Resource, ResourceCatalog)
+
+
+_valid_catalog_ids = [
+    "/a",
+    "/_a",
+    "/ab_c",
+    "/a9_b/c__99"
+]
+
+_invalid_catalog_ids = [
+    "",
+    "/",
+    "/a/",
+    "/9",
+    "a"
+]
+
+_valid_resource_ids = [
+    "_temp",
+    "temp",
+    "Temp",
+    "Temp_1"
+]
+
+_invalid_resource_ids = [
+    "",
+    "1temp",
+    "teßp",
+    "ª♫",
+    "tem p",
+    "tem-p",
+    "tem*p"
+]
+
+_valid_parameter_ids = [
+    "_temp",
+    "temp",
+    "Temp_1"
+]
+
+_invalid_parameter_ids = [
+    "",
+    "1temp",
+    "tem p",
+    "tem\x00p",
+    "temp\n"
+]
+
+_valid_data_types = [
+    NexusDataType.FLOAT32
+]
+
+# deliberately invalid values, so they are not typed as NexusDataType
+_invalid_data_types: list[Any] = [
+    0,
+    9999
+]
+
+def can_validate_catalog_id_test():
+
+    for id in _valid_catalog_ids:
         ResourceCatalog(id)
 
-    else:
+    for id in _invalid_catalog_ids:
         with pytest.raises(Exception):
             ResourceCatalog(id)
 
+def can_validate_resource_id_test():
 
-@pytest.mark.parametrize(
-    "id, is_valid", 
-    [
-        ("_temp", True),
-        ("temp", True),
-        ("Temp", True),
-        ("Temp_1", True),
-
-        ("", False),
-        ("1temp", False),
-        ("teßp", False),
-        ("ª♫", False),
-        ("tem p", False),
-        ("tem-p", False),
-        ("tem*p", False)
-    ])
-def can_validate_resource_id_test(id: str, is_valid: bool):
-
-    if is_valid:
+    for id in _valid_resource_ids:
         Resource(id)
 
-    else:
+    for id in _invalid_resource_ids:
         with pytest.raises(Exception):
             Resource(id)
 
 @pytest.mark.parametrize(
-    "sample_period_string, is_valid", 
+    "sample_period, is_valid", 
     [
-        ("00:01:00", True),
-        ("00:00:00", False),
-    ])
-def can_validate_representation_sample_period_test(sample_period_string: str, is_valid: bool):
-
-    datetime_tmp = datetime.strptime(sample_period_string, "%H:%M:%S")
-
-    sample_period = timedelta(
-        hours=datetime_tmp.hour, 
-        minutes=datetime_tmp.minute, 
-        seconds=datetime_tmp.second)
+        (timedelta(minutes=1), True),
+        (timedelta(0), False),
+    ],
+    ids=["1min", "zero"])
+def can_validate_representation_sample_period_test(sample_period: timedelta, is_valid: bool):
 
     if is_valid:
         Representation(
@@ -80,26 +100,34 @@ def can_validate_representation_sample_period_test(sample_period_string: str, is
                 NexusDataType.FLOAT64, 
                 sample_period)
 
-@pytest.mark.parametrize(
-    "data_type, is_valid", 
-    [
-        (NexusDataType.FLOAT32, True),
-        (0, False),
-        (9999, False),
-    ])
-def can_validate_representation_data_type_test(data_type: NexusDataType, is_valid: bool):
+def can_validate_representation_data_type_test():
 
-    if is_valid:
+    for data_type in _valid_data_types:
         Representation(
             data_type, 
             timedelta(seconds=1))
 
-    else:
+    for data_type in _invalid_data_types:
         with pytest.raises(Exception):
             Representation(
                 data_type, 
                 timedelta(seconds=1))
 
+def can_validate_representation_parameter_id_test():
+
+    for id in _valid_parameter_ids:
+        Representation(
+            NexusDataType.FLOAT64, 
+            timedelta(seconds=1),
+            parameters={ "a": {}, id: {} })
+
+    for id in _invalid_parameter_ids:
+        with pytest.raises(Exception):
+            Representation(
+                NexusDataType.FLOAT64, 
+                timedelta(seconds=1),
+                parameters={ "a": {}, id: {} })
+
 def catalog_constructor_throws_for_non_unique_resource_test():
     
     with pytest.raises(Exception):
@@ -108,3 +136,27 @@ def catalog_constructor_throws_for_non_unique_resource_test():
             Resource(id="R2"),
             Resource(id="R2")
         ])
+
+    with pytest.raises(Exception):
+        ResourceCatalog(id="/C", resources=[Resource(id=f"R{i}") for i in range(10_000)] + [Resource(id="R0")])
+
+@pytest.mark.parametrize(
+    "parameters, expected", 
+    [
+        (None, "/A/B/T1/10_ms"),
+        ({ "a": "1", "b": "2" }, "/A/B/T1/10_ms(a=1,b=2)")
+    ],
+    ids=["without_parameters", "with_parameters"])
+def can_create_catalog_item_path_test(parameters, expected: str):
+
+    # arrange
+    representation = Representation(NexusDataType.FLOAT64, timedelta(milliseconds=10))
+    resource = Resource("T1", representations=[representation])
+    catalog = ResourceCatalog("/A/B", resources=[resource])
+    catalog_item = CatalogItem(catalog, resource, representation, parameters)
+
+    # act
+    actual = catalog_item.to_path()
+
+    # assert
+    assert expected == actual
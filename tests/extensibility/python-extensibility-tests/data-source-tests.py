@@ -0,0 +1,100 @@
+import copy
+import pickle
+from datetime import timedelta
+from urllib.parse import urlparse
+
+import pytest
+from nexus_extensibility import (CatalogItem, DataSourceContext, ILogger,
+                                 LogLevel, NexusDataType, ReadRequest,
+                                 Representation, Resource, ResourceCatalog)
+
+
+class _Logger(ILogger):
+
+    def __init__(self, min_level: LogLevel):
+        self.min_level = min_level
+        self.messages: list[tuple[LogLevel, str]] = []
+
+    def log(self, log_level: LogLevel, message: str):
+        if self.is_enabled(log_level):
+            self.messages.append((log_level, message))
+
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        return log_level >= self.min_level
+
+class _FormatCounter:
+
+    def __init__(self):
+        self.count = 0
+
+    def __str__(self):
+        self.count += 1
+        return "value"
+
+_context = DataSourceContext(
+    resource_locator=urlparse("file:///data"),
+    system_configuration={ "foo": "bar" },
+    source_configuration={ "foo": [1, 2] },
+    request_configuration=None
+)
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))], ids=["copy", "deepcopy", "pickle"])
+def can_clone_data_source_context_test(clone):
+
+    # act
+    actual = clone(_context)
+
+    # assert
+    assert actual == _context
+
+def can_copy_read_request_test():
+
+    # arrange
+    representation = Representation(NexusDataType.FLOAT64, timedelta(seconds=1))
+    resource = Resource("R1", representations=[representation])
+    catalog = ResourceCatalog("/A", resources=[resource])
+    catalog_item = CatalogItem(catalog, resource, representation, None)
+    data = memoryview(bytearray(8))
+    status = memoryview(bytearray(1))
+
+    request = ReadRequest(catalog_item, data, status)
+
+    # act
+    actual = copy.copy(request)
+
+    # assert
+    assert actual.catalog_item is catalog_item
+    assert actual.data is data
+    assert actual.status is status
+
+def is_enabled_defaults_to_true_test():
+
+    # arrange
+    class Logger(ILogger):
+        def log(self, log_level: LogLevel, message: str):
+            pass
+
+    # act
+    actual = Logger().is_enabled(LogLevel.Trace)
+
+    # assert
+    assert actual
+
+def log_lazy_formats_enabled_messages_only_test():
+
+    # arrange
+    logger = _Logger(LogLevel.Information)
+    argument = _FormatCounter()
+
+    # act
+    logger.log_lazy(LogLevel.Debug, "Debug %s", argument)
+    logger.log_lazy(LogLevel.Warning, "Warning %s", argument)
+    logger.log_lazy(LogLevel.Error, "100%")
+
+    # assert
+    assert argument.count == 1
+
+    assert logger.messages == [
+        (LogLevel.Warning, "Warning value"),
+        (LogLevel.Error, "100%")
+    ]
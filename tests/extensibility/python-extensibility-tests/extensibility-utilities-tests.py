@@ -0,0 +1,149 @@
+import asyncio
+import mmap
+import struct
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from nexus_extensibility import (CatalogItem, ExtensibilityUtilities,
+                                 NexusDataType, ReadRequest, Representation,
+                                 Resource, ResourceCatalog)
+
+
+def _create_read_request(catalog_id: str, resource_id: str, data_type: NexusDataType, sample_period: timedelta, data: bytes = b"") -> ReadRequest:
+
+    representation = Representation(data_type, sample_period)
+    resource = Resource(resource_id, representations=[representation])
+    catalog = ResourceCatalog(catalog_id, resources=[resource])
+    catalog_item = CatalogItem(catalog, resource, representation, None)
+
+    return ReadRequest(catalog_item, memoryview(bytearray(data)), memoryview(bytearray(len(data))))
+
+
+@pytest.mark.parametrize(
+    "begin, end, sample_period, expected", 
+    [
+        (datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 1, 2, tzinfo=timezone.utc), timedelta(minutes=1), 1440),
+        (datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc), timedelta(milliseconds=300), 3),
+        (datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2030, 1, 1, tzinfo=timezone.utc), timedelta(microseconds=10), 3653 * 86400 * 100_000)
+    ],
+    ids=["1day_1min", "1s_300ms", "10years_10us"])
+def can_calculate_element_count_test(begin: datetime, end: datetime, sample_period: timedelta, expected: int):
+
+    actual = ExtensibilityUtilities._calculate_element_count(begin, end, sample_period) # type: ignore
+
+    assert actual == expected
+
+@pytest.mark.parametrize(
+    "data_type, format", 
+    [
+        (NexusDataType.UINT8, "B"),
+        (NexusDataType.INT16, "h"),
+        (NexusDataType.UINT32, "I"),
+        (NexusDataType.INT64, "q"),
+        (NexusDataType.FLOAT32, "f"),
+        (NexusDataType.FLOAT64, "d")
+    ],
+    ids=["uint8", "int16", "uint32", "int64", "float32", "float64"])
+def can_cast_data_test(data_type: NexusDataType, format: str):
+
+    # arrange
+    values = [1, 2, 3]
+    request = _create_read_request("/A", "R1", data_type, timedelta(seconds=1), struct.pack(f"=3{format}", *values))
+
+    # act
+    actual = ExtensibilityUtilities.cast_data(request)
+
+    # assert
+    assert actual.format == format
+    assert actual.tolist() == values
+
+def can_group_requests_test():
+
+    # arrange
+    request1 = _create_read_request("/B", "R1", NexusDataType.FLOAT64, timedelta(seconds=1))
+    request2 = _create_read_request("/A", "R2", NexusDataType.FLOAT64, timedelta(seconds=1))
+    request3 = _create_read_request("/B", "R3", NexusDataType.FLOAT64, timedelta(seconds=1))
+    request4 = _create_read_request("/B", "R4", NexusDataType.FLOAT64, timedelta(minutes=1))
+
+    # act
+    actual = ExtensibilityUtilities.group_requests([request1, request2, request3, request4])
+
+    # assert
+    assert list(actual.keys()) == [
+        ("/B", timedelta(seconds=1)),
+        ("/A", timedelta(seconds=1)),
+        ("/B", timedelta(minutes=1))
+    ]
+
+    assert actual[("/B", timedelta(seconds=1))] == [request1, request3]
+    assert actual[("/A", timedelta(seconds=1))] == [request2]
+    assert actual[("/B", timedelta(minutes=1))] == [request4]
+
+def can_create_batched_buffers_test():
+
+    # arrange
+    representations = [
+        Representation(NexusDataType.FLOAT64, timedelta(seconds=1)),
+        Representation(NexusDataType.INT8, timedelta(seconds=1)),
+        Representation(NexusDataType.FLOAT32, timedelta(seconds=1))
+    ]
+
+    begin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 0, 0, 3, tzinfo=timezone.utc)
+
+    # act
+    actual = ExtensibilityUtilities.create_batched_buffers(representations, begin, end)
+
+    for (i, (data, status)) in enumerate(actual, 1):
+        data[:] = bytes([i]) * len(data)
+        status[:] = bytes([i]) * len(status)
+
+    # assert
+    assert [(len(data), len(status)) for (data, status) in actual] == [(24, 3), (3, 3), (12, 3)]
+
+    # the data slices are aligned to 8 bytes, the status slices are contiguous
+    assert bytes(actual[0][0].obj) == b"\x01" * 24 + b"\x02" * 3 + b"\x00" * 5 + b"\x03" * 12 + b"\x00" * 4 # type: ignore
+    assert bytes(actual[0][1].obj) == b"\x01" * 3 + b"\x02" * 3 + b"\x03" * 3 # type: ignore
+
+def can_create_large_buffers_test():
+
+    # arrange
+    representation = Representation(NexusDataType.FLOAT64, timedelta(milliseconds=1))
+    begin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 1, 1, tzinfo=timezone.utc)
+
+    # act
+    (data, status) = ExtensibilityUtilities.create_buffers(representation, begin, end)
+
+    # assert
+    assert isinstance(data.obj, mmap.mmap)
+    assert isinstance(status.obj, mmap.mmap)
+
+    assert len(data) == 3_600_000 * 8
+    assert len(status) == 3_600_000
+
+    assert data[0] == 0 and data[-1] == 0
+    assert status[0] == 0 and status[-1] == 0
+
+    data[-1] = 1
+    assert data[-1] == 1
+
+@pytest.mark.asyncio
+async def can_gather_read_data_test():
+
+    # arrange
+    begin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 2, tzinfo=timezone.utc)
+    delays = { "/A/R1/1_s": 0.02, "/A/R2/1_s": 0.01, "/A/R3/1_s": 0 }
+
+    async def read_data(resource_path: str, begin: datetime, end: datetime) -> memoryview:
+
+        # later resources complete first
+        await asyncio.sleep(delays[resource_path])
+        return memoryview(resource_path.encode())
+
+    # act
+    actual = await ExtensibilityUtilities.gather_read_data(read_data, [(resource_path, begin, end) for resource_path in delays])
+
+    # assert
+    assert [bytes(data).decode() for data in actual] == list(delays)